@@ -10,14 +10,18 @@ from __future__ import annotations
 from typing import List
 
 from ..config import config
-from ..config.queries import queries
+from ..config.queries import render
 from ..infra.db import get_connection
 
 
 def query_fechas_mesas() -> List[dict]:
-    """Retrieve the start and end dates of upcoming mesas tournaments."""
+    """Retrieve the start and end dates of upcoming mesas tournaments.
+
+    The query compares against ``GETDATE()``, so its result is never
+    cached.
+    """
     db = get_connection('mesas')
-    sql = queries['fechasMesas'](config.DB_SCHEMA_MESAS)
+    sql = render('fechasMesas', config.DB_SCHEMA_MESAS)
     try:
         result = db.query(sql)
         return result.get('rows', [])
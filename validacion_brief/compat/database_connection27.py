@@ -3,61 +3,205 @@ Compatibility layer for database queries (27 series).
 
 This module provides a collection of helper functions that execute SQL
 queries defined in ``validacion_brief.config.queries`` against either
-the promotions or mesas database.  Each function logs the SQL and
-parameters prior to execution and returns the list of rows.
+the promotions or mesas database.  Each function logs the query name and
+parameters prior to execution (the SQL itself at ``DEBUG``) and returns
+the list of rows.
 
 The naming of functions (e.g. ``queryMultiplicador``) mirrors the
 TypeScript code.  Functions suffixed with ``Seg`` operate on
 individual execution segments rather than promotions as a whole.
+
+The promotion-scoped queries are sent together as a single batch
+(``promoBundle``) the first time any of them is needed for a promotion;
+the remaining ones are served from that batch.  Segment-scoped results
+are memoized as well, so that validating segments and then etapas does
+not repeat the same round trips.  Results that depend on ``GETDATE()``
+(``segmentos``) are never cached.  ``reset_query_cache`` is called at the
+start of each run.
+
+The ``*SegBatch`` variants fetch a segment-scoped query for many
+segments with a single ``IN (...)`` statement and return the rows
+grouped by segment id; they share the cache with their per-segment
+counterparts.  ``querySegmentTables`` runs several of them concurrently,
+each on its own pooled connection.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Sequence
 
 from ..config import config
-from ..config.queries import queries
+from ..config.queries import PROMO_BUNDLE_KEYS, render, render_segment_batch
 from ..infra.db import get_connection
+from ..infra.db.query_cache import cache_key, query_cache
+
+logger = logging.getLogger(__name__)
+
+
+# Segment-scoped queries whose results cannot change during one run.
+_CACHEABLE = frozenset({
+    'multiplicadorSeg',
+    'equivalenciasSeg',
+    'configuracionesSeg',
+    'premiosSeg',
+    'etapasSeg',
+})
+
+# Bundle result sets that depend on ``GETDATE()``.  They are returned
+# straight from the batch and never cached, so callers outside a
+# validation run (which never reset the cache) always see current data.
+_VOLATILE = frozenset({'segmentos'})
 
 
 def _execute(alias: str, sql_key: str, params: dict) -> List[dict]:
-    """Internal helper to obtain a connection, run a query and close it."""
+    """Internal helper to obtain a connection, run a query and close it.
+
+    Results of queries in ``_CACHEABLE`` are memoized in ``query_cache``
+    for the rest of the validation run.
+    """
+    cacheable = sql_key in _CACHEABLE
+    if cacheable:
+        key = cache_key(alias, sql_key, params)
+        cached = query_cache.get(key)
+        if cached is not None:
+            return cached
     db = get_connection(alias)
-    sql_func = queries[sql_key]
-    sql = sql_func(config.DB_SCHEMA_PROMOS if alias == 'promos' else config.DB_SCHEMA_MESAS)
-    logging.info(f"[DB] {sql_key} executing", extra={"sql": sql, "params": params})
+    sql = render(sql_key, config.DB_SCHEMA_PROMOS if alias == 'promos' else config.DB_SCHEMA_MESAS)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[DB] %s executing params=%s", sql_key, params)
+        logger.debug("[DB] %s sql=%s", sql_key, sql)
     try:
         result = db.query(sql, params)
         rows = result.get('rows', [])
-        logging.info(f"[DB] {sql_key} returned rows", extra={"count": len(rows)})
-        return rows
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[DB] %s returned %d rows", sql_key, len(rows))
     finally:
         db.close()
+    if cacheable:
+        query_cache.put(key, rows)
+    return rows
+
+
+# Segment ids per ``IN (...)`` statement; SQL Server allows at most 2100
+# parameters per request.
+_SEGMENT_CHUNK = 1000
+
+
+def _execute_segments(sql_key: str, segment_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    """Run a ``*Seg`` query for several segments in as few round trips as possible.
+
+    Segments already present in ``query_cache`` are not queried again.
+    Every requested id appears in the result, with an empty list when the
+    database returned no rows for it.
+    """
+    ids = list(dict.fromkeys(int(i) for i in segment_ids))
+    keys = {seg_id: cache_key('promos', sql_key, {'idSegmento': seg_id}) for seg_id in ids}
+    result: Dict[int, List[dict]] = {}
+    missing: List[int] = []
+    for seg_id in ids:
+        cached = query_cache.get(keys[seg_id])
+        if cached is None:
+            missing.append(seg_id)
+        else:
+            result[seg_id] = cached
+    for start in range(0, len(missing), _SEGMENT_CHUNK):
+        chunk = missing[start:start + _SEGMENT_CHUNK]
+        sql = render_segment_batch(sql_key, config.DB_SCHEMA_PROMOS, len(chunk))
+        params = {f'idSegmento{i}': seg_id for i, seg_id in enumerate(chunk)}
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[DB] %s executing for %d segments", sql_key, len(chunk))
+            logger.debug("[DB] %s sql=%s", sql_key, sql)
+        # Stream the rows straight into their segment buckets instead of
+        # materializing the combined result set first.
+        grouped: Dict[int, List[dict]] = {seg_id: [] for seg_id in chunk}
+        count = 0
+        db = get_connection('promos')
+        try:
+            for row in db.iter_query(sql, params):
+                grouped[int(row['id_ejecucion_segmento'])].append(row)
+                count += 1
+        finally:
+            db.close()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[DB] %s returned %d rows", sql_key, count)
+        for seg_id, seg_rows in grouped.items():
+            query_cache.put(keys[seg_id], seg_rows)
+            result[seg_id] = seg_rows
+    return result
+
+
+def _bundled(sql_key: str, promo_id: int) -> List[dict]:
+    """Return one promotion-scoped result set, running the bundle on a miss.
+
+    The first request for a promotion sends every query in
+    ``PROMO_BUNDLE_KEYS`` in one round trip and caches each result set
+    except those in ``_VOLATILE``, which always run the bundle.
+
+    Raises:
+        RuntimeError: If the batch returns a different number of result
+            sets than ``PROMO_BUNDLE_KEYS``.
+    """
+    params = {'idPromocion': promo_id}
+    if sql_key not in _VOLATILE:
+        cached = query_cache.get(cache_key('promos', sql_key, params))
+        if cached is not None:
+            return cached
+    db = get_connection('promos')
+    sql = render('promoBundle', config.DB_SCHEMA_PROMOS)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[DB] promoBundle executing params=%s", params)
+        logger.debug("[DB] promoBundle sql=%s", sql)
+    try:
+        results = db.query_multi(sql, params)
+    finally:
+        db.close()
+    # A statement that failed or a ``nextset`` that stopped early must
+    # not pass for empty tables.
+    if len(results) != len(PROMO_BUNDLE_KEYS):
+        raise RuntimeError(
+            f"promoBundle returned {len(results)} result sets, expected {len(PROMO_BUNDLE_KEYS)}"
+        )
+    rows_by_key = {
+        bundle_key: result.get('rows', [])
+        for bundle_key, result in zip(PROMO_BUNDLE_KEYS, results)
+    }
+    for bundle_key, rows in rows_by_key.items():
+        if bundle_key not in _VOLATILE:
+            query_cache.put(cache_key('promos', bundle_key, params), rows)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[DB] promoBundle returned %d result sets", len(results))
+    return rows_by_key[sql_key]
+
+
+def reset_query_cache() -> None:
+    """Forget results memoized during a previous validation run."""
+    query_cache.clear()
 
 
 def queryMultiplicador(promo_id: int) -> List[dict]:
-    return _execute('promos', 'multiplicador', {'idPromocion': promo_id})
+    return _bundled('multiplicador', promo_id)
 
 
 def queryEquivalencias(promo_id: int) -> List[dict]:
-    return _execute('promos', 'equivalencias', {'idPromocion': promo_id})
+    return _bundled('equivalencias', promo_id)
 
 
 def queryConfiguraciones(promo_id: int) -> List[dict]:
-    return _execute('promos', 'configuraciones', {'idPromocion': promo_id})
+    return _bundled('configuraciones', promo_id)
 
 
 def queryPremios(promo_id: int) -> List[dict]:
-    return _execute('promos', 'premios', {'idPromocion': promo_id})
+    return _bundled('premios', promo_id)
 
 
 def queryEtapas(promo_id: int) -> List[dict]:
-    return _execute('promos', 'etapas', {'idPromocion': promo_id})
+    return _bundled('etapas', promo_id)
 
 
 def querySegmentos(promo_id: int) -> List[dict]:
-    return _execute('promos', 'segmentos', {'idPromocion': promo_id})
+    return _bundled('segmentos', promo_id)
 
 
 def queryMultiplicadorSeg(segment_id: int) -> List[dict]:
@@ -78,3 +222,41 @@ def queryPremiosSeg(segment_id: int) -> List[dict]:
 
 def queryEtapasSeg(segment_id: int) -> List[dict]:
     return _execute('promos', 'etapasSeg', {'idSegmento': segment_id})
+
+
+def queryMultiplicadorSegBatch(segment_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    return _execute_segments('multiplicadorSeg', segment_ids)
+
+
+def queryEquivalenciasSegBatch(segment_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    return _execute_segments('equivalenciasSeg', segment_ids)
+
+
+def queryConfiguracionesSegBatch(segment_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    return _execute_segments('configuracionesSeg', segment_ids)
+
+
+def queryPremiosSegBatch(segment_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    return _execute_segments('premiosSeg', segment_ids)
+
+
+def queryEtapasSegBatch(segment_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    return _execute_segments('etapasSeg', segment_ids)
+
+
+def querySegmentTables(sql_keys: Sequence[str], segment_ids: Iterable[int]) -> Dict[str, Dict[int, List[dict]]]:
+    """Fetch several ``*Seg`` tables for the same segments concurrently.
+
+    The queries are independent and I/O bound, so each one runs in its
+    own thread with a connection from the pool; the elapsed time is that
+    of the slowest query rather than the sum of all of them.
+
+    Returns:
+        A mapping of ``sql_key`` to the rows grouped by segment id.
+    """
+    ids = list(segment_ids)
+    if len(sql_keys) <= 1:
+        return {key: _execute_segments(key, ids) for key in sql_keys}
+    with ThreadPoolExecutor(max_workers=len(sql_keys)) as executor:
+        futures = {key: executor.submit(_execute_segments, key, ids) for key in sql_keys}
+        return {key: future.result() for key, future in futures.items()}
@@ -16,6 +16,7 @@ Supported variables:
 * ``EMAIL_TO`` – default recipient email address.
 * ``DB_SCHEMA_PROMOS`` – schema name for the promotions DB (default ``'dbo'``).
 * ``DB_SCHEMA_MESAS`` – schema name for the mesas DB (default ``'dbo'``).
+* ``DB_POOL_SIZE`` – maximum open connections per database alias (default ``10``).
 
 The resulting ``config`` instance can be imported from
 ``validacion_brief.config``.
@@ -27,9 +28,11 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 from dotenv import load_dotenv
+
+# Variables already set in the environment take precedence over ``.env``.
 load_dotenv()
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Holds environment configuration for the application."""
 
@@ -40,6 +43,7 @@ class Config:
     EMAIL_TO: Optional[str] = None
     DB_SCHEMA_PROMOS: str = "dbo"
     DB_SCHEMA_MESAS: str = "dbo"
+    DB_POOL_SIZE: int = 10
 
 
 def _load_env() -> Config:
@@ -65,6 +69,7 @@ def _load_env() -> Config:
     email_to = os.environ.get("EMAIL_TO")
     db_schema_promos = os.environ.get("DB_SCHEMA_PROMOS", "dbo")
     db_schema_mesas = os.environ.get("DB_SCHEMA_MESAS", "dbo")
+    db_pool_size = int(os.environ.get("DB_POOL_SIZE") or 10)
 
     return Config(
         MSSQL_PROMOS_URL=mssql_promos_url,
@@ -74,6 +79,7 @@ def _load_env() -> Config:
         EMAIL_TO=email_to,
         DB_SCHEMA_PROMOS=db_schema_promos,
         DB_SCHEMA_MESAS=db_schema_mesas,
+        DB_POOL_SIZE=db_pool_size,
     )
 
 
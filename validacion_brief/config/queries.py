@@ -15,6 +15,7 @@ implementation; see ``validacion_brief.infra.db.mssql``.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Callable, Dict
 
 
@@ -161,6 +162,29 @@ def fechasMesas(schema: str) -> str:
     """.strip()
 
 
+# Promotion-scoped queries that can be sent to the server as a single
+# batch.  The order here is the order of the result sets returned by
+# ``promoBundle``.
+PROMO_BUNDLE_KEYS = (
+    "multiplicador",
+    "equivalencias",
+    "configuraciones",
+    "premios",
+    "etapas",
+    "segmentos",
+)
+
+
+def promoBundle(schema: str) -> str:
+    """Concatenate every promotion-scoped query into one batch.
+
+    Each statement already ends with ``;`` so the server returns one
+    result set per entry of ``PROMO_BUNDLE_KEYS``, all sharing the
+    ``@idPromocion`` parameter.
+    """
+    return "\n".join(queries[key](schema) for key in PROMO_BUNDLE_KEYS)
+
+
 # Aggregate the functions in a dictionary to mirror the original TypeScript
 # ``queries`` export.  This allows code to reference
 # ``queries.multiplicador(...)`` etc.
@@ -177,4 +201,37 @@ queries: Dict[str, Callable[[str], str]] = {
     "premiosSeg": premiosSeg,
     "etapasSeg": etapasSeg,
     "fechasMesas": fechasMesas,
+    "promoBundle": promoBundle,
 }
+
+
+@lru_cache(maxsize=None)
+def render(name: str, schema: str) -> str:
+    """Return the SQL for ``queries[name]``, built once per schema.
+
+    The templates are constant, so callers on the hot path should use
+    this instead of calling the template function for every query.  The
+    returned string is also what ``Db`` caches its placeholder rewrite
+    against.
+    """
+    return queries[name](schema)
+
+
+# Filter shared by every segment-scoped (``*Seg``) template.
+_SEGMENT_FILTER = "WHERE e.id_ejecucion_segmento = @idSegmento"
+
+
+@lru_cache(maxsize=256)
+def render_segment_batch(name: str, schema: str, count: int) -> str:
+    """Return a ``*Seg`` query rewritten to match ``count`` segments at once.
+
+    The single ``@idSegmento`` filter becomes an ``IN`` list of
+    ``@idSegmento0`` … ``@idSegmento{count-1}`` parameters.  Every
+    segment template selects ``e.id_ejecucion_segmento`` so callers can
+    split the combined result back per segment.
+    """
+    sql = render(name, schema)
+    if _SEGMENT_FILTER not in sql:
+        raise ValueError(f"Query {name!r} is not segment-scoped")
+    placeholders = ", ".join(f"@idSegmento{i}" for i in range(count))
+    return sql.replace(_SEGMENT_FILTER, f"WHERE e.id_ejecucion_segmento IN ({placeholders})")
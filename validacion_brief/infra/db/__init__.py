@@ -8,4 +8,5 @@ implementation in ``mssql.ts``.
 """
 
 from .mssql import connect, Db  # noqa: F401
-from .connection_factory import get_connection  # noqa: F401
+from .connection_factory import get_connection, shutdown  # noqa: F401
+from .query_cache import QueryCache, query_cache  # noqa: F401
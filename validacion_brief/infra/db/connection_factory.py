@@ -2,40 +2,181 @@
 Database connection factory.
 
 This module mirrors the TypeScript ``ConnectionFactory.ts``.  It uses
-the configured connection strings to lazily create new database
+the configured connection strings to lazily create database
 connections.  See ``validacion_brief.config.env.Config`` for
 configuration variables.
+
+Connections are kept in a small pool per alias so that the many short
+queries issued during a validation run do not each pay for a new
+TCP/TLS handshake and login.  ``get_connection`` hands out a
+``PooledDb`` whose ``close()`` returns the connection to the pool
+instead of closing it, unless a statement on it failed or its rows
+were not fully read; ``shutdown()`` closes every idle connection.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Callable
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections.abc import Mapping
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from ...config import config
 from .mssql import connect, Db
 
 
-# Registry mapping aliases to callables that return a ``Db`` instance.
-_registry: Dict[str, Callable[[], Db]] = {
-    'promos': lambda: connect(config.MSSQL_PROMOS_URL),
-    'mesas': lambda: connect(config.MSSQL_MESAS_URL),
+# Seconds to wait for a free connection before giving up.
+_ACQUIRE_TIMEOUT = 30.0
+# Connections idle for longer than this are checked with ``SELECT 1``
+# before being handed out again.
+_IDLE_CHECK_SECONDS = 60.0
+
+
+class PooledDb(Db):
+    """``Db`` borrowed from a pool; ``close()`` hands it back.
+
+    A connection whose statement raised, or whose ``iter_query`` rows
+    were not read to the end, may be dropped or left mid-result; it is
+    closed instead of being returned to the pool.
+    """
+
+    __slots__ = ('_db', '_pool', '_broken')
+
+    def __init__(self, db: Db, pool: '_ConnectionPool') -> None:
+        super().__init__(db._conn, db._driver)
+        self._db = db
+        self._pool = pool
+        self._broken = False
+
+    def query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        try:
+            return super().query(sql, params)
+        except BaseException:
+            self._broken = True
+            raise
+
+    def query_multi(self, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        try:
+            return super().query_multi(sql, params)
+        except BaseException:
+            self._broken = True
+            raise
+
+    def iter_query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Mapping]:
+        # Until the last row is read the connection has pending results
+        broken, self._broken = self._broken, True
+        yield from super().iter_query(sql, params)
+        self._broken = broken
+
+    def close(self) -> None:
+        pool = self._pool
+        if pool is None:
+            return
+        self._pool = None
+        if self._broken:
+            pool.discard(self._db)
+        else:
+            pool.release(self._db)
+
+
+class _ConnectionPool:
+    """Bounded, thread-safe pool of ``Db`` instances for one alias."""
+
+    def __init__(self, factory: Callable[[], Db], size: int) -> None:
+        self._factory = factory
+        self._idle: 'queue.LifoQueue[tuple[Db, float]]' = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(1, size))
+
+    def acquire(self, timeout: float = _ACQUIRE_TIMEOUT) -> PooledDb:
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError('Timed out waiting for a pooled database connection')
+        try:
+            try:
+                db, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                db = self._factory()
+            else:
+                if time.monotonic() - last_used > _IDLE_CHECK_SECONDS and not _is_alive(db):
+                    _close_quietly(db)
+                    db = self._factory()
+        except BaseException:
+            self._slots.release()
+            raise
+        return PooledDb(db, self)
+
+    def release(self, db: Db) -> None:
+        self._idle.put((db, time.monotonic()))
+        self._slots.release()
+
+    def discard(self, db: Db) -> None:
+        """Close a connection that must not be reused and free its slot."""
+        _close_quietly(db)
+        self._slots.release()
+
+    def drain(self) -> None:
+        while True:
+            try:
+                db, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close_quietly(db)
+
+
+def _is_alive(db: Db) -> bool:
+    try:
+        db.query('SELECT 1')
+        return True
+    except Exception:
+        return False
+
+
+def _close_quietly(db: Db) -> None:
+    try:
+        db.close()
+    except Exception as err:
+        logging.debug('[db] Error closing pooled connection', exc_info=err)
+
+
+# Connection strings per alias, read from the configuration once.
+_args: Dict[str, str] = {
+    'promos': config.MSSQL_PROMOS_URL,
+    'mesas': config.MSSQL_MESAS_URL,
+}
+
+_pools: Dict[str, _ConnectionPool] = {
+    alias: _ConnectionPool(partial(connect, url), config.DB_POOL_SIZE)
+    for alias, url in _args.items()
 }
 
 
 def get_connection(alias: str) -> Db:
-    """Obtain a new database connection by alias.
+    """Obtain a pooled database connection by alias.
 
     Args:
         alias: Either ``'promos'`` or ``'mesas'``.
 
     Returns:
-        A new ``Db`` instance connected to the appropriate database.
+        A ``Db`` instance connected to the appropriate database.  Calling
+        ``close()`` on it returns the connection to the pool.
 
     Raises:
         KeyError: If the alias is not registered.
+        TimeoutError: If no connection becomes available in time.
     """
-    try:
-        factory = _registry[alias]
-    except KeyError:
-        raise KeyError(f"No connection defined for alias: {alias}") from None
-    return factory()
+    pool = _pools.get(alias)
+    if pool is None:
+        raise KeyError(f"No connection defined for alias: {alias}")
+    return pool.acquire()
+
+
+def shutdown() -> None:
+    """Close every idle pooled connection."""
+    for pool in _pools.values():
+        pool.drain()
+
+
+atexit.register(shutdown)
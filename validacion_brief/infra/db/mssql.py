@@ -8,7 +8,9 @@ connect using either ``pymssql`` or ``pyodbc``.  If neither driver is
 available, the ``connect`` function will raise an ``ImportError``.
 
 The ``connect`` function returns an instance of ``Db``, which exposes
-``query(sql: str, params: dict | None)`` and ``close()`` methods.  SQL
+``query(sql: str, params: dict | None)``, ``query_multi`` (for batches
+returning several result sets), ``iter_query`` (streaming rows) and
+``close()`` methods.  SQL
 strings may include named parameters prefixed with ``@`` (e.g.
 ``@idPromocion``).  When using ``pymssql``, these parameter tokens will
 be replaced with Python ``%(id)s`` placeholders.  ``pyodbc`` uses
@@ -30,7 +32,90 @@ exception.  For a production system you should install either
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Tuple, Optional, Iterable
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Named ``@param`` tokens inside SQL templates.
+_PARAM_RE = re.compile(r"@([A-Za-z0-9_]+)")
+
+
+@lru_cache(maxsize=64)
+def _pymssql_sql(sql: str) -> str:
+    """Rewrite ``@param`` tokens to ``%(param)s`` placeholders."""
+    return _PARAM_RE.sub(r"%(\1)s", sql)
+
+
+@lru_cache(maxsize=64)
+def _pyodbc_sql(sql: str) -> Tuple[str, Tuple[str, ...]]:
+    """Rewrite ``@param`` tokens to ``?`` and list names in order of appearance."""
+    return _PARAM_RE.sub("?", sql), tuple(_PARAM_RE.findall(sql))
+
+
+class Row(Mapping):
+    """Read-only, dict-like view of one ``pyodbc`` result row.
+
+    Column names live once on a per-result-set subclass (see
+    ``_row_type``); each instance only references the driver's value
+    sequence, so no per-row dictionary is built.  Rows support the
+    usual ``row['col']`` and ``row.get('col')`` access and ``dict(row)``.
+    """
+
+    __slots__ = ('_values',)
+    _index: Dict[str, int] = {}
+
+    def __init__(self, values: Sequence[Any]) -> None:
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[self._index[key]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        idx = self._index.get(key)
+        return default if idx is None else self._values[idx]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"Row({dict(self)!r})"
+
+    # Rows are immutable, so copies can share the instance.
+    def __copy__(self) -> 'Row':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Row':
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return dict, (list(self.items()),)
+
+
+# Rows requested from the driver per round of ``fetchmany``.
+_FETCH_SIZE = 1000
+
+
+def _iter_rows(cursor: Any) -> Iterator[Any]:
+    """Yield rows from ``cursor`` in ``_FETCH_SIZE`` chunks."""
+    while True:
+        chunk = cursor.fetchmany(_FETCH_SIZE)
+        if not chunk:
+            return
+        yield from chunk
+
+
+@lru_cache(maxsize=64)
+def _row_type(columns: Tuple[str, ...]) -> type:
+    """Return the ``Row`` subclass for a given column tuple."""
+    index = {name: i for i, name in enumerate(columns)}
+    return type('Row', (Row,), {'__slots__': (), '_index': index})
 
 
 class Db:
@@ -40,6 +125,8 @@ class Db:
     are returned by the ``connect`` function defined below.
     """
 
+    __slots__ = ('_conn', '_driver')
+
     def __init__(self, conn: Any, driver: str) -> None:
         self._conn = conn
         self._driver = driver
@@ -61,7 +148,8 @@ class Db:
         Returns:
             A dictionary containing a ``rows`` key whose value is a list
             of rows returned by the query.  Each row is a mapping from
-            column name to value.
+            column name to value (a ``dict`` for ``pymssql``, a read-only
+            ``Row`` for ``pyodbc``).
         """
         params = params or {}
         if self._driver == "pymssql":
@@ -71,34 +159,92 @@ class Db:
         else:
             raise RuntimeError(f"Unsupported driver: {self._driver}")
 
-    def _execute_pymssql(self, sql: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        # Replace @param tokens with %(param)s placeholders
-        def replacer(match: re.Match[str]) -> str:
-            name = match.group(1)
-            return f"%({name})s"
+    def query_multi(self, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Execute a batch of statements and return one result per set.
+
+        ``sql`` may contain several ``;``-separated ``SELECT`` statements
+        sharing the same named parameters.  The result sets are read from
+        a single cursor with ``nextset()`` so the whole batch costs one
+        round trip.
+
+        Returns:
+            A list with one ``{"rows": [...]}`` dictionary per result set,
+            in statement order.
+        """
+        params = params or {}
+        if self._driver == "pymssql":
+            return self._execute_pymssql(sql, params, multi=True)
+        elif self._driver == "pyodbc":
+            return self._execute_pyodbc(sql, params, multi=True)
+        else:
+            raise RuntimeError(f"Unsupported driver: {self._driver}")
+
+    def iter_query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Mapping]:
+        """Execute a query and yield its rows one by one.
 
-        query = re.sub(r"@([A-Za-z0-9_]+)", replacer, sql)
+        Rows are pulled from the driver in chunks of ``_FETCH_SIZE`` so
+        callers that only fold over the result (counting, grouping) never
+        hold the whole result set in memory.  The connection must not be
+        used for another statement until the iterator is exhausted.
+        """
+        params = params or {}
+        if self._driver == "pymssql":
+            with self._conn.cursor(as_dict=True) as cursor:
+                cursor.execute(_pymssql_sql(sql), params)
+                yield from _iter_rows(cursor)
+        elif self._driver == "pyodbc":
+            cursor = self._pyodbc_cursor(sql, params)
+            if not cursor.description:
+                return
+            row_type = _row_type(tuple(col[0] for col in cursor.description))
+            for row in _iter_rows(cursor):
+                yield row_type(row)
+        else:
+            raise RuntimeError(f"Unsupported driver: {self._driver}")
+
+    def _execute_pymssql(self, sql: str, params: Dict[str, Any], multi: bool = False) -> Any:
+        query = _pymssql_sql(sql)
+        results: List[Dict[str, Any]] = []
         with self._conn.cursor(as_dict=True) as cursor:
             cursor.execute(query, params)
-            rows = cursor.fetchall() or []
-        return {"rows": rows}
-
-    def _execute_pyodbc(self, sql: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        # Extract parameter names in order of appearance
-        names = re.findall(r"@([A-Za-z0-9_]+)", sql)
-        # Replace named parameters with positional placeholders
-        query = re.sub(r"@([A-Za-z0-9_]+)", "?", sql)
+            while True:
+                results.append({"rows": list(_iter_rows(cursor))})
+                if not multi or not cursor.nextset():
+                    break
+        return results if multi else results[0]
+
+    def _pyodbc_cursor(self, sql: str, params: Dict[str, Any]) -> Any:
+        query, names = _pyodbc_sql(sql)
         values: Iterable[Any] = [params.get(name) for name in names]
         cursor = self._conn.cursor()
+        cursor.arraysize = _FETCH_SIZE
         cursor.execute(query, list(values))
-        columns = [col[0] for col in cursor.description] if cursor.description else []
-        rows = [dict(zip(columns, row)) for row in cursor.fetchall()] if columns else []
-        return {"rows": rows}
+        return cursor
+
+    def _execute_pyodbc(self, sql: str, params: Dict[str, Any], multi: bool = False) -> Any:
+        cursor = self._pyodbc_cursor(sql, params)
+        results: List[Dict[str, Any]] = []
+        while True:
+            if cursor.description:
+                row_type = _row_type(tuple(col[0] for col in cursor.description))
+                rows = [row_type(row) for row in _iter_rows(cursor)]
+            else:
+                rows = []
+            results.append({"rows": rows})
+            if not multi or not cursor.nextset():
+                break
+        return results if multi else results[0]
 
     def close(self) -> None:
         self._conn.close()
 
 
+_SQLSERVER_PREFIX_RE = re.compile(r"^sqlserver://", re.IGNORECASE)
+# ``key=value`` pairs of a semicolon-separated connection string
+_KV_RE = re.compile(r"([^=;]+)=([^;]*)")
+_SERVER_PORT_RE = re.compile(r"^(.*?),(\d+)$")
+
+
 def parse_connection_string(input_str: str) -> Dict[str, Any]:
     """Parse a SQL Server connection string into its components.
 
@@ -118,23 +264,21 @@ def parse_connection_string(input_str: str) -> Dict[str, Any]:
     if not s:
         raise ValueError("Empty connection string")
     # Normalise mssql:// prefix
-    norm = re.sub(r"^sqlserver://", "mssql://", s, flags=re.IGNORECASE)
+    norm = _SQLSERVER_PREFIX_RE.sub("mssql://", s)
     if norm.lower().startswith("mssql://"):
         # Return URL as-is; downstream clients can handle it
         return {"url": norm}
-    parts = [p.strip() for p in norm.split(";") if p.strip()]
-    kv: Dict[str, str] = {}
-    for p in parts:
-        if '=' not in p:
-            continue
-        k, v = p.split('=', 1)
-        kv[k.strip().lower()] = v.strip()
+    # Collect every key=value pair in a single scan
+    kv: Dict[str, str] = {
+        m.group(1).strip().lower(): m.group(2).strip()
+        for m in _KV_RE.finditer(norm)
+    }
     server_raw = kv.get('server') or kv.get('data source') or kv.get('address') or kv.get('addr') or kv.get('network address')
     if not server_raw:
         raise ValueError('No Server= found in connection string')
     server = server_raw
     port: Optional[int] = None
-    m = re.match(r"^(.*?),(\d+)$", server_raw)
+    m = _SERVER_PORT_RE.match(server_raw)
     if m:
         server = m.group(1)
         port = int(m.group(2))
@@ -161,8 +305,9 @@ def connect(raw: str) -> Db:
 
     This function attempts to create a connection using either
     ``pymssql`` or ``pyodbc``.  If both are unavailable a runtime
-    error will be raised.  Connection pooling is delegated to the
-    underlying library.
+    error will be raised.  Pooling of ``Db`` instances is handled by
+    ``connection_factory``; ODBC-level pooling is also enabled for
+    ``pyodbc``.
 
     Args:
         raw: The raw connection string from the environment.
@@ -194,6 +339,8 @@ def connect(raw: str) -> Db:
     # Fallback to pyodbc
     try:
         import pyodbc  # type: ignore[import]
+        # Let the ODBC driver manager reuse physical connections as well
+        pyodbc.pooling = True
         # If the URL form is provided, let pyodbc parse it
         if url:
             conn = pyodbc.connect(url, autocommit=True)
@@ -214,6 +361,10 @@ def connect(raw: str) -> Db:
                 f"UID={user};PWD={password};"
                 f"Encrypt={'yes' if encrypt else 'no'};"
                 f"TrustServerCertificate={'yes' if trust else 'no'};"
+                # Larger TDS packets and MARS let batched result sets stream
+                # over fewer round trips on the same connection
+                "MARS_Connection=yes;"
+                "Packet Size=32768;"
             )
             conn = pyodbc.connect(conn_str, autocommit=True)
         return Db(conn, "pyodbc")
@@ -0,0 +1,51 @@
+"""
+In-process cache of read-only query results.
+
+A validation run issues the same segment queries from several phases
+(segments, then etapas).  ``query_cache`` memoizes those results for
+the duration of a single run; ``validate_all`` clears it before
+starting.  Only queries whose result cannot change within a run should
+be cached – see the allowlists in the ``compat`` modules.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+
+def cache_key(alias: str, sql_key: str, params: Mapping[str, Any]) -> Tuple[Hashable, ...]:
+    """Build the lookup key for a query and its parameters."""
+    return alias, sql_key, frozenset(params.items())
+
+
+class QueryCache:
+    """Thread-safe mapping of query keys to result rows.
+
+    Hits return a deep copy so callers may mutate the rows freely
+    without affecting later readers.  ``put`` stores the value as-is, so
+    the caller that fetched the rows returns them without a copy and must
+    not mutate them afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Shared cache used by the query helpers in ``validacion_brief.compat``.
+query_cache = QueryCache()
@@ -6,17 +6,172 @@ This function posts an HTML email to a configured endpoint.  It
 supports adding extra recipients on the fly, concatenated with the
 default ``EMAIL_TO`` from the environment.  The API key is sent in
 the ``ApiKeyApp`` header.
+
+Requests go through a module-level ``requests.Session`` so repeated
+sends reuse pooled keep-alive connections.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+import socket
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ...config import config
 
+logger = logging.getLogger(__name__)
+
+
+# Fields of the request body that never change between sends.
+_BODY_TEMPLATE: Dict[str, Any] = {
+    "key": "NOTIFICACIONESQA",
+    "conCopia": [],
+    "adjuntos": [],
+    "copiaOculta": "",
+    "isHtml": True,
+}
+_STATIC_HEADERS = {"accept": "*/*", "Content-Type": "application/json"}
+
+
+def _socket_options() -> List[Tuple[int, int, int]]:
+    """Disable Nagle and keep idle pooled connections alive."""
+    options = list(HTTPConnection.default_socket_options) + [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    # Keep-alive timing knobs are not available on every platform
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose pooled sockets use ``_socket_options``."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs['socket_options'] = _socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _retry_policy() -> Retry:
+    """Retry transient failures with exponential backoff and jitter.
+
+    Sending an email is not idempotent, so only failures where the
+    service cannot have accepted the message are retried: connection
+    errors and 429/503 rejections.  Read timeouts and other 5xx answers
+    are not retried, since the email may already have gone out.  After
+    the last attempt the response is returned so ``raise_for_status``
+    still reports the final HTTP error.
+    """
+    options: Dict[str, Any] = dict(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=0.25, **options)
+    except TypeError:
+        # ``backoff_jitter`` needs urllib3 2.x
+        return Retry(**options)
+
+
+def _build_session() -> requests.Session:
+    """Create the shared keep-alive session used for every send."""
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=_retry_policy(),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(_STATIC_HEADERS)
+    return session
+
+
+_SESSION = _build_session()
+
+
+class EmailConfig(NamedTuple):
+    endpoint: str
+    key: str
+    default_to: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _email_cfg() -> EmailConfig:
+    """Validate and snapshot the email settings; they never change during a run.
+
+    A missing endpoint or key raises ``ValueError``; ``lru_cache`` does
+    not store exceptions, so the check is repeated until it succeeds.
+    """
+    endpoint, key, default_to = config.EMAIL_ENDPOINT, config.EMAIL_KEY, config.EMAIL_TO
+    if not endpoint or not key:
+        raise ValueError("EMAIL_ENDPOINT/EMAIL_KEY not configured (set in environment)")
+    return EmailConfig(endpoint, key, default_to)
+
+
+def close_email_session() -> None:
+    """Close pooled connections held by the shared session."""
+    _SESSION.close()
+
+
+def _parse_response(response: Any) -> dict:
+    """Decode the service's JSON reply straight from the raw bytes."""
+    content = response.content
+    if not content:
+        return {}
+    if orjson is not None:
+        return orjson.loads(content)
+    return response.json()
+
+
+def _unique_recipients(default_to: Optional[str], extra_to: Optional[List[str]]) -> List[str]:
+    """Default recipient first, then extra addresses, trimmed and deduplicated.
+
+    Addresses are compared case-insensitively; the first spelling wins.
+    """
+    seen: Set[str] = set()
+    out: List[str] = []
+    for addr in chain((default_to,), extra_to or ()):
+        if not addr:
+            continue
+        addr = addr.strip()
+        folded = addr.lower()
+        if addr and folded not in seen:
+            seen.add(folded)
+            out.append(addr)
+    return out
+
+
+def _build_request(subject: str, html: str, extra_to: Optional[List[str]]) -> Tuple[EmailConfig, Dict[str, Any]]:
+    """Validate the settings and build the JSON request body."""
+    cfg = _email_cfg()
+    para = ",".join(_unique_recipients(cfg.default_to, extra_to))
+    json_body = {**_BODY_TEMPLATE, "para": para, "asunto": subject, "body": html}
+    # Log email details without sensitive information
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[email] Sending HTML email to %s: %s", para, subject)
+    return cfg, json_body
+
 
 def send_html_email(subject: str, html: str, extra_to: Optional[List[str]] = None) -> dict:
     """Send an HTML email using the configured notification endpoint.
@@ -33,36 +188,12 @@ def send_html_email(subject: str, html: str, extra_to: Optional[List[str]] = Non
         ValueError: If ``EMAIL_ENDPOINT`` or ``EMAIL_KEY`` are missing.
         requests.RequestException: If the HTTP request fails.
     """
-    if not config.EMAIL_ENDPOINT or not config.EMAIL_KEY:
-        raise ValueError("EMAIL_ENDPOINT/EMAIL_KEY not configured (set in environment)")
-    # Build recipient list
-    to_list: List[str] = []
-    if config.EMAIL_TO:
-        to_list.append(config.EMAIL_TO)
-    if extra_to:
-        to_list.extend([addr for addr in extra_to if addr])
-    para = ",".join(to_list)
-    json_body = {
-        "key": "NOTIFICACIONESQA",
-        "para": para,
-        "conCopia": [],
-        "adjuntos": [],
-        "copiaOculta": "",
-        "asunto": subject,
-        "body": html,
-        "isHtml": True,
-    }
-    # Log email details without sensitive information
-    logging.info("[email] Sending HTML email", extra={"para": para, "subject": subject})
-    response = requests.post(
-        config.EMAIL_ENDPOINT,
+    cfg, json_body = _build_request(subject, html, extra_to)
+    response = _SESSION.post(
+        cfg.endpoint,
         json=json_body,
-        headers={
-            "accept": "*/*",
-            "ApiKeyApp": config.EMAIL_KEY,
-            "Content-Type": "application/json",
-        },
-        timeout=20,
+        headers={"ApiKeyApp": cfg.key},
+        timeout=(3.05, 20),
     )
     response.raise_for_status()
-    return response.json()
+    return _parse_response(response)
@@ -3,27 +3,248 @@ JSON reporting utilities.
 
 Functions in this module mirror the ``jsonReporter.ts`` file from the
 TypeScript project.  They provide simple wrappers for ensuring a
-directory exists and writing JSON files atomically.
+directory exists and writing JSON files atomically.  Serialization uses
+``orjson`` when it is installed and falls back to the standard
+``json`` module otherwise.  Besides plain containers, reports may hold
+read-only mappings and dataclass instances.
 """
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
-from pathlib import Path
-from typing import Any
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+from typing import Any, BinaryIO, Dict, Set, Tuple
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    # ISA-L's gzip is a faster drop-in for large reports
+    from isal import igzip as _gzip  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    import gzip as _gzip
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Large write buffer so big reports reach the kernel in few syscalls.
+_WRITE_BUFFER = 1 << 20
+
+
+def _report_mode() -> int:
+    # ``os.umask`` can only be read by setting it, so do it once at import
+    # rather than racing other threads on every write.
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Mode a plain ``open()`` would give new reports under the process umask.
+_REPORT_MODE = _report_mode()
+
+logger = logging.getLogger(__name__)
+
+
+# Directories already created by ``ensure_dir`` in this process.
+_ensured_dirs: Set[str] = set()
+_ensured_lock = threading.Lock()
 
 
 def ensure_dir(directory: str) -> None:
-    """Ensure a directory exists, creating it recursively if necessary."""
-    logging.info("[jsonReporter] ensure_dir", extra={"dir": directory})
-    Path(directory).mkdir(parents=True, exist_ok=True)
+    """Ensure a directory exists, creating it recursively if necessary.
+
+    Directories are remembered once created, so repeated calls for the
+    same path cost a set lookup instead of an ``mkdir``.
+    """
+    if directory in _ensured_dirs:
+        return
+    with _ensured_lock:
+        if directory in _ensured_dirs:
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[jsonReporter] ensure_dir %s", directory)
+        os.makedirs(directory or '.', exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
+def _forget_dir(directory: str) -> None:
+    with _ensured_lock:
+        _ensured_dirs.discard(directory)
+
+
+def _json_default(obj: Any) -> Any:
+    # Database rows may be read-only mappings rather than plain dicts
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    # Report records may be dataclasses; ``orjson`` serializes those
+    # natively, the standard library encoder needs a shallow dict.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+
+
+def _write_all(fd: int, buf: bytes) -> None:
+    view = memoryview(buf)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _stream_json(fh: BinaryIO, data: Any) -> None:
+    """Serialize ``data`` as indented UTF-8 JSON into a binary file object."""
+    if orjson is not None:
+        fh.write(orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS))
+        return
+    text = io.TextIOWrapper(fh, encoding='utf-8', write_through=False)
+    try:
+        for chunk in _ENCODER.iterencode(data):
+            text.write(chunk)
+        text.flush()
+    finally:
+        text.detach()
+
+
+def _write_payload(fd: int, data: Any, compress: bool = False) -> None:
+    """Serialize ``data`` as indented UTF-8 JSON into the open file ``fd``.
+
+    Uncompressed reports are encoded to a single ``bytes`` object (with
+    ``orjson`` when available, otherwise the standard library encoder)
+    that goes straight to ``os.write`` without any Python I/O layers.
+    With ``compress`` the encoder's output is streamed through a
+    buffered gzip stream at level 1 with a fixed ``mtime`` so identical
+    reports produce identical files.
+    """
+    if not compress:
+        if orjson is not None:
+            payload = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+        else:
+            payload = _ENCODER.encode(data).encode('utf-8')
+        _write_all(fd, payload)
+        return
+    with os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER, closefd=False) as raw:
+        with _gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=1, mtime=0) as gz:
+            _stream_json(gz, data)
+
+
+def _fsync(fd: int) -> None:
+    # On macOS ``fsync`` does not flush the drive cache; F_FULLFSYNC does
+    if sys.platform == 'darwin':
+        import fcntl
+        fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+    else:
+        os.fsync(fd)
+
+
+def fsync_dir(directory: str) -> None:
+    """Persist a rename by syncing the containing directory (POSIX only)."""
+    if os.name != 'posix':
+        return
+    dir_fd = os.open(directory or '.', os.O_DIRECTORY)
+    try:
+        _fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _mkstemp(file_path: str, directory: str) -> Tuple[int, str]:
+    return tempfile.mkstemp(
+        dir=directory or None,
+        prefix='.' + os.path.basename(file_path) + '.',
+        suffix='.tmp',
+    )
+
+
+# Reports written with ``durable=False`` whose data and renames have
+# not been synced yet, by directory.  See ``flush_reports``.
+_pending: Dict[str, Set[str]] = {}
+_pending_lock = threading.Lock()
+
+
+def _fsync_file(file_path: str) -> None:
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
+        # Replaced or removed since it was written; nothing left to sync
+        return
+    try:
+        _fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def flush_reports() -> None:
+    """Make every non-durable report written so far crash-safe.
+
+    Each pending report file is synced first, then its directory once,
+    so the published name never points at unsynced data.
+    """
+    with _pending_lock:
+        pending = list(_pending.items())
+        _pending.clear()
+    for directory, files in pending:
+        for file_path in files:
+            _fsync_file(file_path)
+        fsync_dir(directory)
+
+
+def write_json(file_path: str, data: Any, *, durable: bool = True, compress: bool = False) -> None:
+    """Write an object to a JSON file, ensuring the directory exists.
+
+    The data is written to a temporary file in the same directory,
+    flushed to disk and then renamed over ``file_path``, so readers never
+    observe a truncated report even if the process dies mid-write.
 
+    Callers emitting many small reports may pass ``durable=False`` to
+    defer the ``fsync`` calls: the write stays atomic, but the report is
+    not crash-safe until ``flush_reports()`` has synced it, which callers
+    must do before handing the results to the user.
 
-def write_json(file_path: str, data: Any) -> None:
-    """Write an object to a JSON file, ensuring the directory exists."""
-    ensure_dir(os.path.dirname(file_path))
-    logging.info("[jsonReporter] write_json", extra={"file": file_path})
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    With ``compress=True`` the report is gzip-compressed and written to
+    ``file_path + '.gz'``.
+    """
+    if compress:
+        file_path += '.gz'
+    directory = os.path.dirname(file_path)
+    ensure_dir(directory)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[jsonReporter] write_json %s", file_path)
+    try:
+        fd, tmp_path = _mkstemp(file_path, directory)
+    except FileNotFoundError:
+        # The directory was removed after ``ensure_dir`` remembered it
+        _forget_dir(directory)
+        ensure_dir(directory)
+        fd, tmp_path = _mkstemp(file_path, directory)
+    try:
+        try:
+            _write_payload(fd, data, compress)
+            if durable:
+                _fsync(fd)
+        finally:
+            os.close(fd)
+        # mkstemp creates files as 0600; apply the umask-derived mode instead
+        os.chmod(tmp_path, _REPORT_MODE)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    if durable:
+        fsync_dir(directory)
+    else:
+        with _pending_lock:
+            _pending.setdefault(directory, set()).add(file_path)
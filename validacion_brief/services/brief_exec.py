@@ -14,13 +14,27 @@ and database calls suffice.
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
+from graphlib import TopologicalSorter
+from operator import itemgetter
 from pathlib import Path
 import shutil
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+from datetime import date, datetime, time, timedelta
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ..compat.database_connection27 import (
     queryMultiplicador,
@@ -29,296 +43,239 @@ from ..compat.database_connection27 import (
     queryPremios,
     queryEtapas,
     querySegmentos,
-    queryMultiplicadorSeg,
-    queryEquivalenciasSeg,
-    queryConfiguracionesSeg,
-    queryPremiosSeg,
-    queryEtapasSeg,
+    queryEtapasSegBatch,
+    querySegmentTables,
+    reset_query_cache,
 )
-from ..infra.reporting.json_reporter import ensure_dir, write_json
+from ..config import config
+from ..infra.reporting.json_reporter import ensure_dir, flush_reports, fsync_dir, write_json
 
 # Type aliases for readability
 PromoConfig = Dict[str, Any]
 
-def load_ejecucion_config() -> Dict[str, PromoConfig]:
-    """Assemble execution configuration solely from the JSON rule templates.
+# Number of per-segment tables ``validate_segments`` may fetch concurrently.
+_SEGMENT_TABLE_COUNT = 5
 
-    This implementation no longer reads from ``Ejecucion_config.json``.  Instead
-    it constructs a configuration dictionary for each promotion based on the
-    template files in the ``nuevo`` folder.  Promotions are mapped as follows:
+def _read_rules(filepath: Path) -> Any:
+    """Read and parse a JSON rule file, using ``orjson`` when available."""
+    data = filepath.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    * ``17`` (TOP)         → ``ranking-top.rules.full.json``【465686397035438†L0-L18】.
-    * ``18`` (Estelar)     → mode ``estelar`` in ``sorteos.rules.full.json``.
-    * ``19`` (Sueños)      → mode ``suenos`` in ``sorteos.rules.full.json``.
-    * ``22`` (Salta y Gana)→ ``sorteos.saltaYGana.rules.json``【602207407408589†L0-L20】.
+def _parse_range_position(pos: str) -> Tuple[int, int, int]:
+    """Convert a position string (e.g., "1" or "11-20") into
+    (cond_min, cond_max, ganadores).  When a single position is provided,
+    the maximum is zero and the number of winners is one.  When a range
+    is provided, the number of winners equals the range length.【465686397035438†L71-L84】"""
+    # Fast path: most positions are a plain integer
+    if pos.isdecimal():
+        return int(pos), 0, 1
+    if '-' in pos:
+        start_str, end_str = pos.split('-', 1)
+        try:
+            start = int(start_str)
+            end = int(end_str)
+            return start, end, (end - start + 1)
+        except ValueError:
+            pass
+    # Fallback: treat as single position
+    try:
+        return int(pos), 0, 1
+    except ValueError:
+        return 0, 0, 1
 
-    Each rule file provides default values (multiplicador, equivalencias,
-    configuraciones, premios) and stage logic.  The stage names are
-    upper‑cased when constructing the configuration.  For ranking, stage
-    identifiers are mapped to their legacy names (e.g., ``planificacion``
-    becomes ``PLANIFICADO``) to mirror the original specification.
+# Ranking ``logic`` keys and the legacy stage names they map to.
+_RANKING_STAGE_MAP = {
+    'planificacion': 'PLANIFICADO',
+    'preEjecucion': 'PRE_EJECUCION',
+    'validacion': 'VALIDACION',
+    'recalculo': 'RECALCULO',
+    'resultado': 'RESULTADO',
+    'resultadoIview': 'RESULTADO_IVIEW',
+    'pago': 'PAGOS_FISICO',
+    'vencido': 'PAGOS_FISICO_VENCIDOS',
+    'finalizado': 'FINALIZADO',
+    'acumulacion': 'ACUMULACION',
+}
+
+# Homologar nombres de etapas de sorteos a los usados en BD
+_SORTEOS_STAGE_HOMOLOG = {
+    'PLANIFICACION': 'PLANIFICADO',
+    'PREEJECUCION': 'PRE EJECUCION',
+}
+
+# Simple fields copied verbatim from a rule file's ``defaults``.
+_DEFAULT_KEYS = ('multiplicador', 'equivalencias', 'configuraciones')
+# Schedule fields copied from ``defaults`` when non-empty.
+_SCHEDULE_KEYS = ('durations', 'hours')
+
+def _copy_defaults(defaults: Dict[str, Any], cfg: PromoConfig) -> None:
+    """Copy the simple numeric or list fields present in ``defaults``."""
+    for key in _DEFAULT_KEYS:
+        if key in defaults:
+            cfg[key] = defaults[key]
+
+def _copy_schedule(defaults: Dict[str, Any], cfg: PromoConfig) -> None:
+    """Copy durations and hours for stage validation, when defined."""
+    for key in _SCHEDULE_KEYS:
+        value = defaults.get(key)
+        if value:
+            cfg[key] = value
+
+def _premios_from_ganadores(premios_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert sorteo ``premio``/``ganadores`` entries to the legacy premios format."""
+    premios_cfg: List[Dict[str, Any]] = []
+    for p in premios_list:
+        premio_val = p.get('premio')
+        ganadores_val = p.get('ganadores')
+        if premio_val is None or ganadores_val is None:
+            continue
+        premios_cfg.append({
+            'valor_premio': float(premio_val),
+            'cantidad_ganadores': float(ganadores_val),
+            'condicion_minima': 0,
+            'condicion_maxima': 0,
+        })
+    return premios_cfg
+
+def _sorteo_stages(schema: Any, logic: Any) -> Dict[str, Dict[str, Any]]:
+    """Derive sorteo stage names from a rules ``schema`` or ``logic`` section.
+
+    The keys under ``schema['state']`` are preferred: the ``etapa`` prefix
+    (case‑insensitive) is removed and the rest upper‑cased, so
+    ``'etapaPlanificacion'`` becomes ``'PLANIFICACION'``.  Otherwise the
+    upper‑cased ``logic`` keys are used.  Names are then homologated to
+    the ones stored in the database and ``SORTEO`` is always included.
     """
-    def parse_range_position(pos: str) -> (int, int, int):
-        """Convert a position string (e.g., "1" or "11-20") into
-        (cond_min, cond_max, ganadores).  When a single position is provided,
-        the maximum is zero and the number of winners is one.  When a range
-        is provided, the number of winners equals the range length.【465686397035438†L71-L84】"""
-        try:
-            if '-' in pos:
-                start_str, end_str = pos.split('-', 1)
-                start = int(start_str)
-                end = int(end_str)
-                return start, end, (end - start + 1)
-            # Single position
-            val = int(pos)
-            return val, 0, 1
-        except Exception:
-            # Fallback: treat as single position
-            try:
-                val = int(pos)
-                return val, 0, 1
-            except Exception:
-                return 0, 0, 1
-
-    def parse_ranking_top(filepath: Path) -> Optional[PromoConfig]:
-        """Parse the ranking rules file and return a configuration dict.
-
-        The ranking rules specify prizes by position ranges and omit explicit
-        winner counts.  This helper reconstructs the equivalent ``premios``
-        structure by inferring the number of winners from position ranges.
-        Stage keys from the logic section are mapped to their legacy names.
-        """
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                rules = json.load(f)
-            defaults = rules.get('defaults', {})
-            config: PromoConfig = {}
-            # Basic fields
-            if 'multiplicador' in defaults:
-                config['multiplicador'] = defaults['multiplicador']
-            if 'equivalencias' in defaults:
-                config['equivalencias'] = defaults['equivalencias']
-            if 'configuraciones' in defaults:
-                config['configuraciones'] = defaults['configuraciones']
-            # Premios: convert position ranges to condition ranges and winner counts
-            premios = defaults.get('premios', [])
-            premios_cfg: List[Dict[str, Any]] = []
-            for p in premios:
-                pos = p.get('posicion')
-                premio_val = p.get('premio')
-                if pos is None or premio_val is None:
-                    continue
-                cond_min, cond_max, ganadores = parse_range_position(str(pos))
-                premios_cfg.append({
-                    'valor_premio': float(premio_val),
-                    'cantidad_ganadores': float(ganadores),
-                    'condicion_minima': float(cond_min),
-                    'condicion_maxima': float(cond_max),
-                })
-            if premios_cfg:
-                config['premios'] = premios_cfg
-            # Copy durations and hours for stage validation
-            durations = defaults.get('durations')
-            if durations:
-                config['durations'] = durations
-            hours = defaults.get('hours')
-            if hours:
-                config['hours'] = hours
-            # Stage names: map logic keys to legacy stage names
-            stage_map = {
-                'planificacion': 'PLANIFICADO',
-                'preEjecucion': 'PRE_EJECUCION',
-                'validacion': 'VALIDACION',
-                'recalculo': 'RECALCULO',
-                'resultado': 'RESULTADO',
-                'resultadoIview': 'RESULTADO_IVIEW',
-                'pago': 'PAGOS_FISICO',
-                'vencido': 'PAGOS_FISICO_VENCIDOS',
-                'finalizado': 'FINALIZADO',
-                'acumulacion': 'ACUMULACION',
-            }
-            etapas = {}
-            logic = rules.get('logic', {})
-            if isinstance(logic, dict):
-                for stage_key in logic.keys():
-                    name = stage_map.get(stage_key, stage_key.upper())
-                    etapas[name] = {}
-            if etapas:
-                config['etapas'] = etapas
-            return config
-        except Exception:
-            return None
+    state_def = schema.get('state') if isinstance(schema, dict) else None
+    stage_keys: List[str] = []
+    if isinstance(state_def, dict):
+        for key in state_def.keys():
+            cleaned = key
+            if cleaned.lower().startswith('etapa'):
+                cleaned = cleaned[5:]
+            stage_keys.append(cleaned.upper())
+    elif isinstance(logic, dict):
+        stage_keys = [k.upper() for k in logic.keys()]
+    stage_keys_homol = [_SORTEOS_STAGE_HOMOLOG.get(k, k) for k in stage_keys]
+    if 'SORTEO' not in stage_keys_homol:
+        stage_keys_homol.append('SORTEO')
+    return {st_name: {} for st_name in stage_keys_homol}
 
-    def parse_sorteos_rules(filepath: Path) -> Dict[str, PromoConfig]:
-        """Parse the sorteo rules file and return a mapping of mode names to configs."""
-        configs: Dict[str, PromoConfig] = {}
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                rules = json.load(f)
-
-            # Determine the list of stage names.  If the file defines a
-            # ``schema_et_sorteos`` section, use the keys under
-            # ``schema_et_sorteos.state`` (removing the ``etapa`` prefix and
-            # upper‑casing) as the stage names.  Otherwise fall back to the
-            # keys from ``logic_sorteos``.  This allows unifying stages for
-            # Estelar and Sueños when a common template is provided.
-            etapas: Dict[str, Dict[str, Any]] = {}
-            schema_et = rules.get('schema_et_sorteos', {})
-            state_def = schema_et.get('state') if isinstance(schema_et, dict) else None
-            stage_keys: List[str] = []
-            if isinstance(state_def, dict):
-                for key in state_def.keys():
-                    # Remove the 'etapa' prefix (case‑insensitive) and
-                    # upper‑case the remaining string.  For example,
-                    # 'etapaPlanificacion' becomes 'PLANIFICACION'.
-                    cleaned = key
-                    if cleaned.lower().startswith('etapa'):
-                        cleaned = cleaned[5:]
-                    stage_keys.append(cleaned.upper())
-            else:
-                logic_sorteos = rules.get('logic_sorteos', {})
-                if isinstance(logic_sorteos, dict):
-                    stage_keys = [k.upper() for k in logic_sorteos.keys()]
-            # Homologar nombres a los usados en BD y agregar SORTEO
-            homolog_map = {
-                'PLANIFICACION': 'PLANIFICADO',
-                'PREEJECUCION': 'PRE EJECUCION',
-            }
-            stage_keys_homol = [homolog_map.get(k, k) for k in stage_keys]
-            if 'SORTEO' not in stage_keys_homol:
-                stage_keys_homol.append('SORTEO')
-            for st_name in stage_keys_homol:
-                etapas[st_name] = {}
-
-            # Process each mode defined in the rules.  Each mode has its own
-            # defaults (multiplicador, equivalencias, configuraciones, premios).
-            modes = rules.get('modes', {})
-            for mode_name, mode_def in modes.items():
-                defaults = mode_def.get('defaults', {})
-                cfg: PromoConfig = {}
-                # Copy the simple numeric or list fields
-                if 'multiplicador' in defaults:
-                    cfg['multiplicador'] = defaults['multiplicador']
-                if 'equivalencias' in defaults:
-                    cfg['equivalencias'] = defaults['equivalencias']
-                if 'configuraciones' in defaults:
-                    cfg['configuraciones'] = defaults['configuraciones']
-                # Convert premios to the expected legacy format
-                premios_list = defaults.get('premios', [])
-                premios_cfg: List[Dict[str, Any]] = []
-                for p in premios_list:
-                    premio_val = p.get('premio')
-                    ganadores_val = p.get('ganadores')
-                    if premio_val is None or ganadores_val is None:
-                        continue
-                    premios_cfg.append({
-                        'valor_premio': float(premio_val),
-                        'cantidad_ganadores': float(ganadores_val),
-                        'condicion_minima': 0,
-                        'condicion_maxima': 0,
-                    })
-                if premios_cfg:
-                    cfg['premios'] = premios_cfg
-                # Share the same stage names across modes
-                if etapas:
-                    cfg['etapas'] = dict(etapas)
-
-                # Copy common durations and hours from top-level definitions if present
-                durations_common = rules.get('durations_et_sorteos')
-                if durations_common:
-                    cfg['durations_common'] = durations_common
-                hours_common = rules.get('hours_et_sorteos')
-                if hours_common:
-                    cfg['hours_common'] = hours_common
-                # Copy mode‑specific durations for accumulation cycles if present
-                durations_mode = defaults.get('durations')
-                if durations_mode:
-                    cfg['durations_mode'] = durations_mode
-                configs[mode_name] = cfg
-        except Exception:
-            # In case of any parsing error, return what has been built so far
-            pass
-        return configs
+def _parse_ranking_top(filepath: Path) -> Optional[PromoConfig]:
+    """Parse the ranking rules file and return a configuration dict.
 
-    def parse_salta_y_gana(filepath: Path) -> Optional[PromoConfig]:
-        """Parse the Salta y Gana rules file into a configuration dict."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                rules = json.load(f)
-            defaults = rules.get('defaults', {})
+    The ranking rules specify prizes by position ranges and omit explicit
+    winner counts.  This helper reconstructs the equivalent ``premios``
+    structure by inferring the number of winners from position ranges.
+    Stage keys from the logic section are mapped to their legacy names.
+    """
+    try:
+        rules = _read_rules(filepath)
+        defaults = rules.get('defaults', {})
+        config: PromoConfig = {}
+        # Basic fields
+        _copy_defaults(defaults, config)
+        # Premios: convert position ranges to condition ranges and winner counts
+        premios = defaults.get('premios', [])
+        premios_cfg: List[Dict[str, Any]] = []
+        for p in premios:
+            pos = p.get('posicion')
+            premio_val = p.get('premio')
+            if pos is None or premio_val is None:
+                continue
+            cond_min, cond_max, ganadores = _parse_range_position(str(pos))
+            premios_cfg.append({
+                'valor_premio': float(premio_val),
+                'cantidad_ganadores': float(ganadores),
+                'condicion_minima': float(cond_min),
+                'condicion_maxima': float(cond_max),
+            })
+        if premios_cfg:
+            config['premios'] = premios_cfg
+        _copy_schedule(defaults, config)
+        # Stage names: map logic keys to legacy stage names
+        etapas = {}
+        logic = rules.get('logic', {})
+        if isinstance(logic, dict):
+            for stage_key in logic.keys():
+                name = _RANKING_STAGE_MAP.get(stage_key, stage_key.upper())
+                etapas[name] = {}
+        if etapas:
+            config['etapas'] = etapas
+        return config
+    except Exception:
+        return None
+
+def _parse_sorteos_rules(filepath: Path) -> Dict[str, PromoConfig]:
+    """Parse the sorteo rules file and return a mapping of mode names to configs."""
+    configs: Dict[str, PromoConfig] = {}
+    try:
+        rules = _read_rules(filepath)
+
+        # Stage names come from ``schema_et_sorteos.state`` or, failing
+        # that, ``logic_sorteos``.  This allows unifying stages for
+        # Estelar and Sueños when a common template is provided.
+        etapas = _sorteo_stages(rules.get('schema_et_sorteos', {}), rules.get('logic_sorteos', {}))
+
+        # Process each mode defined in the rules.  Each mode has its own
+        # defaults (multiplicador, equivalencias, configuraciones, premios).
+        modes = rules.get('modes', {})
+        for mode_name, mode_def in modes.items():
+            defaults = mode_def.get('defaults', {})
             cfg: PromoConfig = {}
-            if 'multiplicador' in defaults:
-                cfg['multiplicador'] = defaults['multiplicador']
-            if 'equivalencias' in defaults:
-                cfg['equivalencias'] = defaults['equivalencias']
-            if 'configuraciones' in defaults:
-                cfg['configuraciones'] = defaults['configuraciones']
-            premios_list = defaults.get('premios', [])
-            premios_cfg: List[Dict[str, Any]] = []
-            for p in premios_list:
-                premio_val = p.get('premio')
-                ganadores_val = p.get('ganadores')
-                if premio_val is None or ganadores_val is None:
-                    continue
-                premios_cfg.append({
-                    'valor_premio': float(premio_val),
-                    'cantidad_ganadores': float(ganadores_val),
-                    'condicion_minima': 0,
-                    'condicion_maxima': 0,
-                })
+            _copy_defaults(defaults, cfg)
+            # Convert premios to the expected legacy format
+            premios_cfg = _premios_from_ganadores(defaults.get('premios', []))
             if premios_cfg:
                 cfg['premios'] = premios_cfg
-            # Copy durations and hours for stage validation
-            durations = defaults.get('durations')
-            if durations:
-                cfg['durations'] = durations
-            hours = defaults.get('hours')
-            if hours:
-                cfg['hours'] = hours
-
-            # Stage names: prefer the keys under ``schema.state`` (removing
-            # 'etapa' prefix and upper‑casing) to derive the legacy stage
-            # names.  Fall back to the keys from ``logic`` when necessary.
-            etapas: Dict[str, Any] = {}
-            schema = rules.get('schema') if isinstance(rules.get('schema'), dict) else None
-            state_def = schema.get('state') if schema else None
-            stage_keys: List[str] = []
-            if isinstance(state_def, dict):
-                for key in state_def.keys():
-                    cleaned = key
-                    if cleaned.lower().startswith('etapa'):
-                        cleaned = cleaned[5:]
-                    stage_keys.append(cleaned.upper())
-            else:
-                logic = rules.get('logic', {})
-                if isinstance(logic, dict):
-                    stage_keys = [k.upper() for k in logic.keys()]
-            # Homologar nombres a los usados en BD y agregar SORTEO
-            homolog_map = {
-                'PLANIFICACION': 'PLANIFICADO',
-                'PREEJECUCION': 'PRE EJECUCION',
-            }
-            stage_keys_homol = [homolog_map.get(k, k) for k in stage_keys]
-            if 'SORTEO' not in stage_keys_homol:
-                stage_keys_homol.append('SORTEO')
-            for st_name in stage_keys_homol:
-                etapas[st_name] = {}
+            # Share the same stage names across modes
             if etapas:
-                cfg['etapas'] = etapas
-            return cfg
-        except Exception:
-            return None
+                cfg['etapas'] = dict(etapas)
 
-    # Build the complete configuration mapping using only the rule templates
-    # All file paths are resolved relative to this module, so that the script
-    # works regardless of the current working directory.  The JSON templates
-    # live alongside this Python file in the ``nuevo`` folder.
-    config: Dict[str, PromoConfig] = {}
+            # Copy common durations and hours from top-level definitions if present
+            durations_common = rules.get('durations_et_sorteos')
+            if durations_common:
+                cfg['durations_common'] = durations_common
+            hours_common = rules.get('hours_et_sorteos')
+            if hours_common:
+                cfg['hours_common'] = hours_common
+            # Copy mode‑specific durations for accumulation cycles if present
+            durations_mode = defaults.get('durations')
+            if durations_mode:
+                cfg['durations_mode'] = durations_mode
+            configs[mode_name] = cfg
+    except Exception:
+        # In case of any parsing error, return what has been built so far
+        pass
+    return configs
+
+def _parse_salta_y_gana(filepath: Path) -> Optional[PromoConfig]:
+    """Parse the Salta y Gana rules file into a configuration dict."""
+    try:
+        rules = _read_rules(filepath)
+        defaults = rules.get('defaults', {})
+        cfg: PromoConfig = {}
+        _copy_defaults(defaults, cfg)
+        premios_cfg = _premios_from_ganadores(defaults.get('premios', []))
+        if premios_cfg:
+            cfg['premios'] = premios_cfg
+        _copy_schedule(defaults, cfg)
+
+        # Stage names: prefer the keys under ``schema.state`` and fall back
+        # to the keys from ``logic`` when necessary.
+        etapas = _sorteo_stages(rules.get('schema'), rules.get('logic', {}))
+        if etapas:
+            cfg['etapas'] = etapas
+        return cfg
+    except Exception:
+        return None
 
-    # Determine the directory containing this script and construct paths to the
-    # rule files relative to it.  Using ``__file__`` ensures the lookup is
-    # correct even when ``brief_exec.py`` is invoked from another location.
-    # Determine the directory containing the JSON rule files.
+def _resolve_json_dir() -> Path:
+    """Locate the directory containing the JSON rule templates."""
+    # All file paths are resolved relative to this module, so that the script
+    # works regardless of the current working directory.
     # In some projects this script lives in ``validacion_brief/services`` and
     # the JSON files reside under ``pages/Brief/JsonGenerales`` at the project
     # root.  In other cases (e.g. when working in isolation in ``reglas/nuevo``)
@@ -336,15 +293,34 @@ def load_ejecucion_config() -> Dict[str, PromoConfig]:
     if json_dir is None:
         # Fallback to the current directory in case the rule files live here.
         json_dir = base_dir
+    return json_dir
+
+# Resolved once at import; the project layout does not change at runtime.
+JSON_DIR = _resolve_json_dir()
+
+def _rule_file_key(path: Path) -> Tuple[str, Optional[int]]:
+    """Return ``(path, mtime_ns)`` for a rule file; mtime is ``None`` if missing."""
+    try:
+        return str(path), path.stat().st_mtime_ns
+    except OSError:
+        return str(path), None
+
+@lru_cache(maxsize=1)
+def _load_config_impl(
+    ranking_key: Tuple[str, Optional[int]],
+    sorteos_key: Tuple[str, Optional[int]],
+    salta_key: Tuple[str, Optional[int]],
+) -> Dict[str, PromoConfig]:
+    """Parse the three rule files identified by their cache keys."""
+    config: Dict[str, PromoConfig] = {}
+
     # Promotion 17 – TOP / Ranking
-    ranking_file = json_dir / 'ranking-top.rules.full.json'
-    ranking_cfg = parse_ranking_top(ranking_file)
+    ranking_cfg = _parse_ranking_top(Path(ranking_key[0]))
     if ranking_cfg:
         config['17'] = ranking_cfg
 
     # Promotion 18 / 19 – Sorteos (Estelar, Sueños)
-    sorteos_file = json_dir / 'sorteos.rules.full.json'
-    sorteos_cfgs = parse_sorteos_rules(sorteos_file)
+    sorteos_cfgs = _parse_sorteos_rules(Path(sorteos_key[0]))
     # Map mode names to their corresponding promo IDs
     for mode_name, cfg in sorteos_cfgs.items():
         name_lower = mode_name.lower()
@@ -354,23 +330,242 @@ def load_ejecucion_config() -> Dict[str, PromoConfig]:
             config['19'] = cfg
 
     # Promotion 22 – Salta y Gana
-    salta_file = json_dir / 'sorteos.saltaYGana.rules.json'
-    salta_cfg = parse_salta_y_gana(salta_file)
+    salta_cfg = _parse_salta_y_gana(Path(salta_key[0]))
     if salta_cfg:
         config['22'] = salta_cfg
     return config
 
-def _out_dir_for_promo(promo_id: str) -> Path:
-    return Path(f'pages/Brief/Validaciones/{promo_id}')
+def load_ejecucion_config() -> Dict[str, PromoConfig]:
+    """Assemble execution configuration solely from the JSON rule templates.
+
+    This implementation no longer reads from ``Ejecucion_config.json``.  Instead
+    it constructs a configuration dictionary for each promotion based on the
+    template files in the ``nuevo`` folder.  Promotions are mapped as follows:
+
+    * ``17`` (TOP)         → ``ranking-top.rules.full.json``【465686397035438†L0-L18】.
+    * ``18`` (Estelar)     → mode ``estelar`` in ``sorteos.rules.full.json``.
+    * ``19`` (Sueños)      → mode ``suenos`` in ``sorteos.rules.full.json``.
+    * ``22`` (Salta y Gana)→ ``sorteos.saltaYGana.rules.json``【602207407408589†L0-L20】.
+
+    Each rule file provides default values (multiplicador, equivalencias,
+    configuraciones, premios) and stage logic.  The stage names are
+    upper‑cased when constructing the configuration.  For ranking, stage
+    identifiers are mapped to their legacy names (e.g., ``planificacion``
+    becomes ``PLANIFICADO``) to mirror the original specification.
+
+    The parsed result is cached and reused while the modification times
+    of the rule files are unchanged; call ``clear_cache()`` to force a
+    re-read.  A deep copy is returned so callers may mutate it freely.
+    """
+    return copy.deepcopy(dict(_shared_config()))
+
+def _shared_config() -> Mapping[str, PromoConfig]:
+    """Return the cached configuration itself, without copying it.
+
+    For internal callers that only read it, such as ``validate_all``;
+    the result must not be mutated.
+    """
+    key = (
+        _rule_file_key(JSON_DIR / 'ranking-top.rules.full.json'),
+        _rule_file_key(JSON_DIR / 'sorteos.rules.full.json'),
+        _rule_file_key(JSON_DIR / 'sorteos.saltaYGana.rules.json'),
+    )
+    return MappingProxyType(_load_config_impl(*key))
+
+def clear_cache() -> None:
+    """Discard the cached result of ``load_ejecucion_config``."""
+    _load_config_impl.cache_clear()
+
+# Directory holding the published validation reports.
+_VALIDATIONS_ROOT = Path('pages/Brief/Validaciones')
+
+def _out_dir_for_promo(promo_id: str, out_root: Optional[Path] = None) -> Path:
+    return (out_root or _VALIDATIONS_ROOT) / promo_id
+
+@dataclass(slots=True, frozen=True)
+class _Equivalencia:
+    """One normalized equivalencia; serialized as ``min``/``max``/``puntaje``.
+
+    ``max`` is None for an open-ended range.
+    """
+
+    min: float
+    max: Optional[float]
+    puntaje: float
+
+def _normalize_equivalencias_config(input_val: Any) -> List[_Equivalencia]:
+    """Normalize ``equivalencias`` from the rule templates to ``min``/``max``/``puntaje``."""
+    if not input_val:
+        return []
+    arr = input_val if isinstance(input_val, list) else [input_val]
+    result: List[_Equivalencia] = []
+    for e in arr:
+        min_val = float(e.get('minimo') or e.get('min') or e.get('condicion_minima') or 0)
+        max_key = e.get('maximo') if 'maximo' in e else e.get('max')
+        max_val = float(max_key) if max_key is not None else None
+        puntaje = float(e.get('puntaje') or e.get('valor_puntaje') or 0)
+        result.append(_Equivalencia(min_val, max_val, puntaje))
+    return result
+
+def _normalize_equivalencias_rows(rows: List[Dict[str, Any]]) -> List[_Equivalencia]:
+    """Normalize ``equivalenciasSeg`` rows to the same shape as the config."""
+    return [
+        _Equivalencia(
+            float(r['condicion_minima']),
+            None if (max_raw := r.get('condicion_maxima')) is None else float(max_raw),
+            float(r['valor_puntaje']),
+        )
+        for r in rows
+    ]
+
+# An open-ended equivalencia (``max`` is None) sorts after every bounded one.
+_INF = float('inf')
+
+def _equivalencia_sort_key(x: _Equivalencia) -> tuple:
+    return (x.min, _INF if x.max is None else x.max, x.puntaje)
+
+# Sort order for normalized premios; itemgetter avoids a Python-level key call per row.
+_PREMIO_SORT_KEY = itemgetter('valor_premio', 'condicion_minima', 'cantidad_ganadores')
 
-def validate_segments(promo_id: str, cfg: PromoConfig) -> None:
-    """Run validations per execution segment of a promotion."""
-    out_dir = _out_dir_for_promo(promo_id)
+# Normalized premio fields and the source keys accepted for each, in
+# order of preference.
+_PREMIO_FIELDS = (
+    ('condicion_minima', ('condicion_minima', 'minimo', 'min')),
+    ('condicion_maxima', ('condicion_maxima', 'maximo', 'max')),
+    ('valor_premio', ('valor_premio', 'valor')),
+    ('cantidad_ganadores', ('cantidad_ganadores', 'cantidad')),
+)
+
+def _normalize_premio(r: Any) -> Dict[str, float]:
+    """Normalize one premio, probing every accepted key name."""
+    condicion_minima = float(r.get('condicion_minima') or r.get('minimo') or r.get('min') or 0)
+    condicion_maxima = float(r.get('condicion_maxima') or r.get('maximo') or r.get('max') or 0)
+    valor_premio = float(r.get('valor_premio') or r.get('valor') or 0)
+    cantidad_ganadores = float(r.get('cantidad_ganadores') or r.get('cantidad') or 0)
+    return {
+        'condicion_minima': condicion_minima,
+        'condicion_maxima': condicion_maxima,
+        'valor_premio': valor_premio,
+        'cantidad_ganadores': cantidad_ganadores,
+    }
+
+@lru_cache(maxsize=32)
+def _premio_normalizer(keys: frozenset) -> Callable[[Any], Dict[str, float]]:
+    """Return a premio normalizer specialized for rows with ``keys``.
+
+    When exactly one accepted key is present for every field (always the
+    case for database rows and the parsed rule templates) the key lookups
+    are resolved once into an ``itemgetter``; otherwise the generic
+    ``_normalize_premio`` is returned.
+    """
+    columns: List[str] = []
+    for _, candidates in _PREMIO_FIELDS:
+        present = [k for k in candidates if k in keys]
+        if len(present) != 1:
+            return _normalize_premio
+        columns.append(present[0])
+    getter = itemgetter(*columns)
+
+    def normalize(r: Any) -> Dict[str, float]:
+        cmin, cmax, valor, cantidad = getter(r)
+        return {
+            'condicion_minima': float(cmin or 0),
+            'condicion_maxima': float(cmax or 0),
+            'valor_premio': float(valor or 0),
+            'cantidad_ganadores': float(cantidad or 0),
+        }
+    return normalize
+
+def _normalize_premios(arr: List[Any]) -> List[Dict[str, float]]:
+    """Normalize premios from either the config or the database, sorted for comparison."""
+    if not arr:
+        return []
+    normalize = _premio_normalizer(frozenset(arr[0].keys()))
     try:
-        segments = querySegmentos(int(promo_id))
+        result = [normalize(r) for r in arr]
+    except KeyError:
+        # Rows with differing shapes; fall back to probing every key
+        result = [_normalize_premio(r) for r in arr]
+    result.sort(key=_PREMIO_SORT_KEY)
+    return result
+
+@dataclass(slots=True)
+class _PromoPlan:
+    """Expected values for a promotion, computed once before the segment loop.
+
+    A field left as ``None`` means the corresponding check is skipped.
+    ``tables`` lists the ``*Seg`` queries the enabled checks need.
+    """
+
+    tables: Tuple[str, ...] = ()
+    expected_mult: Optional[float] = None
+    expected_eq: Optional[List[_Equivalencia]] = None
+    configuraciones: Optional[Dict[str, Any]] = None
+    # ``(KEY, value, str(value))`` for each configured entry, keys upper-cased.
+    configuraciones_upper: Tuple[Tuple[str, Any, str], ...] = ()
+    expected_premios: Optional[List[Dict[str, float]]] = None
+    expected_etapas: Optional[FrozenSet[str]] = None
+    expected_etapas_sorted: List[str] = field(default_factory=list)
+
+def _build_plan(cfg: PromoConfig) -> _PromoPlan:
+    """Normalize the configured expectations of ``cfg`` once per promotion."""
+    plan = _PromoPlan()
+    tables: List[str] = []
+    if isinstance(cfg.get('multiplicador'), (int, float)):
+        plan.expected_mult = float(cfg['multiplicador'])
+        tables.append('multiplicadorSeg')
+    if cfg.get('equivalencias'):
+        expected_eq = _normalize_equivalencias_config(cfg['equivalencias'])
+        expected_eq.sort(key=_equivalencia_sort_key)
+        plan.expected_eq = expected_eq
+        tables.append('equivalenciasSeg')
+    if cfg.get('configuraciones') and isinstance(cfg['configuraciones'], dict):
+        plan.configuraciones = cfg['configuraciones']
+        plan.configuraciones_upper = tuple((str(k).upper(), v, str(v)) for k, v in cfg['configuraciones'].items())
+        tables.append('configuracionesSeg')
+    if cfg.get('premios') and isinstance(cfg['premios'], list):
+        plan.expected_premios = _normalize_premios(cfg['premios'])
+        tables.append('premiosSeg')
+    if cfg.get('etapas'):
+        etapas_cfg = cfg['etapas']
+        expected_names: List[str] = []
+        if isinstance(etapas_cfg, list):
+            expected_names = [str(name).strip() for e in etapas_cfg if (name := e.get('nombre') or e.get('nombre_etapa'))]
+        elif isinstance(etapas_cfg, dict):
+            expected_names = list(etapas_cfg.keys())
+        # Normalize stage names (remove accents, unify spaces/underscores)
+        plan.expected_etapas = frozenset(_normalize_stage_name(n) for n in expected_names)
+        plan.expected_etapas_sorted = sorted(plan.expected_etapas)
+        tables.append('etapasSeg')
+    plan.tables = tuple(tables)
+    return plan
+
+def validate_segments(promo_id: str, cfg: PromoConfig, segments: Optional[List[Dict[str, Any]]] = None,
+                      out_root: Optional[Path] = None) -> None:
+    """Run validations per execution segment of a promotion.
+
+    ``segments`` may be supplied by a caller that already fetched them;
+    otherwise they are queried here.  Reports are written under
+    ``out_root`` (default ``pages/Brief/Validaciones``).
+    """
+    out_dir = _out_dir_for_promo(promo_id, out_root)
+    try:
+        if segments is None:
+            segments = querySegmentos(int(promo_id))
         if not segments:
             return
         results: List[Dict[str, Any]] = []
+        plan = _build_plan(cfg)
+        # Fetch each per-segment table once for all segments instead of
+        # issuing one query per segment inside the loop; the tables are
+        # independent so they are fetched concurrently.
+        seg_ids = [int(seg['id_ejecucion_segmento']) for seg in segments]
+        tables = querySegmentTables(plan.tables, seg_ids)
+        mult_by_seg = tables.get('multiplicadorSeg', {})
+        eq_by_seg = tables.get('equivalenciasSeg', {})
+        cfg_by_seg = tables.get('configuracionesSeg', {})
+        premios_by_seg = tables.get('premiosSeg', {})
+        etapas_by_seg = tables.get('etapasSeg', {})
         for seg in segments:
             seg_id = int(seg['id_ejecucion_segmento'])
             seg_name = seg.get('nombre_segmento')
@@ -379,14 +574,14 @@ def validate_segments(promo_id: str, cfg: PromoConfig) -> None:
                 'nombreSegmento': seg_name,
             }
             # Multiplicador per segment
-            if isinstance(cfg.get('multiplicador'), (int, float)):
-                rows = queryMultiplicadorSeg(seg_id)
+            if plan.expected_mult is not None:
+                rows = mult_by_seg.get(seg_id, [])
                 values = [float(r.get('valor_multiplicador')) for r in rows]
                 unique = sorted(set(values))
                 seg_result['multiplicador'] = {
                     'expected': cfg['multiplicador'],
                     'found': unique,
-                    'status': 'OK' if len(unique) == 1 and unique[0] == float(cfg['multiplicador']) else 'ERROR',
+                    'status': 'OK' if len(unique) == 1 and unique[0] == plan.expected_mult else 'ERROR',
                 }
             else:
                 seg_result['multiplicador'] = {
@@ -394,39 +589,13 @@ def validate_segments(promo_id: str, cfg: PromoConfig) -> None:
                     'reason': 'No "multiplicador" in JSON',
                 }
             # Equivalencias per segment
-            if cfg.get('equivalencias'):
-                db_rows = queryEquivalenciasSeg(seg_id)
-                # Reuse the same normalization functions
-                def normalize_config(input_val: Any) -> List[Dict[str, Optional[float]]]:
-                    if not input_val:
-                        return []
-                    arr = input_val if isinstance(input_val, list) else [input_val]
-                    result: List[Dict[str, Optional[float]]] = []
-                    for e in arr:
-                        min_val = float(e.get('minimo') or e.get('min') or e.get('condicion_minima') or 0)
-                        max_key = e.get('maximo') if 'maximo' in e else e.get('max')
-                        max_val = float(max_key) if max_key is not None else None
-                        puntaje = float(e.get('puntaje') or e.get('valor_puntaje') or 0)
-                        result.append({'min': min_val, 'max': max_val, 'puntaje': puntaje})
-                    return result
-                def normalize_rows_seg(rows: List[Dict[str, Any]]) -> List[Dict[str, Optional[float]]]:
-                    result: List[Dict[str, Optional[float]]] = []
-                    for r in rows:
-                        min_val = float(r['condicion_minima'])
-                        max_raw = r.get('condicion_maxima')
-                        max_val = float(max_raw) if max_raw is not None else None
-                        puntaje = float(r['valor_puntaje'])
-                        result.append({'min': min_val, 'max': max_val, 'puntaje': puntaje})
-                    return result
-                expected_eq = normalize_config(cfg['equivalencias'])
-                found_eq = normalize_rows_seg(db_rows)
-                # Sort lists for comparison
-                expected_eq.sort(key=lambda x: (x['min'], x['max'] if x['max'] is not None else float('inf'), x['puntaje']))
-                found_eq.sort(key=lambda x: (x['min'], x['max'] if x['max'] is not None else float('inf'), x['puntaje']))
+            if plan.expected_eq is not None:
+                found_eq = _normalize_equivalencias_rows(eq_by_seg.get(seg_id, []))
+                found_eq.sort(key=_equivalencia_sort_key)
                 seg_result['equivalencias'] = {
-                    'expected': expected_eq,
+                    'expected': plan.expected_eq,
                     'found': found_eq,
-                    'status': 'OK' if json.dumps(expected_eq, sort_keys=True) == json.dumps(found_eq, sort_keys=True) else 'ERROR',
+                    'status': 'OK' if plan.expected_eq == found_eq else 'ERROR',
                 }
             else:
                 seg_result['equivalencias'] = {
@@ -434,21 +603,19 @@ def validate_segments(promo_id: str, cfg: PromoConfig) -> None:
                     'reason': 'No "equivalencias" in JSON',
                 }
             # Configuraciones per segment
-            if cfg.get('configuraciones') and isinstance(cfg['configuraciones'], dict) and cfg['configuraciones']:
-                rows_cfg = queryConfiguracionesSeg(seg_id)
-                found_map: Dict[str, Any] = {}
-                for r in rows_cfg:
-                    key = str(r['codigo_compuesto']).upper()
-                    found_map[key] = r['valor_entero']
-                diffs: Dict[str, Dict[str, Any]] = {}
-                all_ok = True
-                for k, v in cfg['configuraciones'].items():
-                    key = str(k).upper()
-                    if str(found_map.get(key)) != str(v):
-                        diffs[key] = {'expected': v, 'found': found_map.get(key)}
-                        all_ok = False
+            if plan.configuraciones is not None:
+                rows_cfg = cfg_by_seg.get(seg_id, [])
+                found_map: Dict[str, Any] = {str(r['codigo_compuesto']).upper(): r['valor_entero'] for r in rows_cfg}
+                # Compare as strings, as before; a missing key compares as 'None'.
+                # Only configured keys are stringified, not every found row.
+                diffs: Dict[str, Dict[str, Any]] = {
+                    key: {'expected': v, 'found': found}
+                    for key, v, v_str in plan.configuraciones_upper
+                    if str(found := found_map.get(key)) != v_str
+                }
+                all_ok = not diffs
                 seg_result['configuraciones'] = {
-                    'expected': cfg['configuraciones'],
+                    'expected': plan.configuraciones,
                     'found': found_map,
                     'diffs': diffs,
                     'status': 'OK' if all_ok else 'ERROR',
@@ -459,29 +626,12 @@ def validate_segments(promo_id: str, cfg: PromoConfig) -> None:
                     'reason': 'No "configuraciones" in JSON',
                 }
             # Premios per segment
-            if cfg.get('premios') and isinstance(cfg['premios'], list):
-                db_rows = queryPremiosSeg(seg_id)
-                def normalize_premios_seg(arr: List[Any]) -> List[Dict[str, float]]:
-                    result: List[Dict[str, float]] = []
-                    for r in arr:
-                        condicion_minima = float(r.get('condicion_minima') or r.get('minimo') or r.get('min') or 0)
-                        condicion_maxima = float(r.get('condicion_maxima') or r.get('maximo') or r.get('max') or 0)
-                        valor_premio = float(r.get('valor_premio') or r.get('valor') or 0)
-                        cantidad_ganadores = float(r.get('cantidad_ganadores') or r.get('cantidad') or 0)
-                        result.append({
-                            'condicion_minima': condicion_minima,
-                            'condicion_maxima': condicion_maxima,
-                            'valor_premio': valor_premio,
-                            'cantidad_ganadores': cantidad_ganadores,
-                        })
-                    result.sort(key=lambda x: (x['valor_premio'], x['condicion_minima'], x['cantidad_ganadores']))
-                    return result
-                expected_premios = normalize_premios_seg(cfg['premios'])
-                found_premios = normalize_premios_seg(db_rows)
+            if plan.expected_premios is not None:
+                found_premios = _normalize_premios(premios_by_seg.get(seg_id, []))
                 seg_result['premios'] = {
-                    'expected': expected_premios,
+                    'expected': plan.expected_premios,
                     'found': found_premios,
-                    'status': 'OK' if json.dumps(expected_premios, sort_keys=True) == json.dumps(found_premios, sort_keys=True) else 'ERROR',
+                    'status': 'OK' if plan.expected_premios == found_premios else 'ERROR',
                 }
             else:
                 seg_result['premios'] = {
@@ -489,22 +639,15 @@ def validate_segments(promo_id: str, cfg: PromoConfig) -> None:
                     'reason': 'No "premios" in JSON',
                 }
             # Etapas per segment
-            if cfg.get('etapas'):
-                etapas_cfg = cfg['etapas']
-                expected_names: List[str] = []
-                if isinstance(etapas_cfg, list):
-                    expected_names = [str(e.get('nombre') or e.get('nombre_etapa') or '').strip() for e in etapas_cfg if (e.get('nombre') or e.get('nombre_etapa'))]
-                elif isinstance(etapas_cfg, dict):
-                    expected_names = list(etapas_cfg.keys())
-                # Normalize stage names (remove accents, unify spaces/underscores)
-                expected_norm = sorted({_normalize_stage_name(n) for n in expected_names})
-                db_rows = queryEtapasSeg(seg_id)
-                found_norm = sorted({_normalize_stage_name(str(r['nombre_etapa'])) for r in db_rows})
-                missing = [n for n in expected_norm if n not in found_norm]
-                extra   = [n for n in found_norm   if n not in expected_norm]
+            if plan.expected_etapas is not None:
+                expected_set = plan.expected_etapas
+                db_rows = etapas_by_seg.get(seg_id, [])
+                found_set = {_normalize_stage_str(str(r['nombre_etapa'])) for r in db_rows}
+                missing = sorted(expected_set - found_set)
+                extra = sorted(found_set - expected_set)
                 seg_result['etapas'] = {
-                    'expected': expected_norm,
-                    'found': found_norm,
+                    'expected': plan.expected_etapas_sorted,
+                    'found': sorted(found_set),
                     'missing': missing,
                     'extra': extra,
                     'status': 'OK' if not missing and not extra else 'ERROR',
@@ -515,42 +658,379 @@ def validate_segments(promo_id: str, cfg: PromoConfig) -> None:
                     'reason': 'No "etapas" in JSON',
                 }
             results.append(seg_result)
-        write_json(str(out_dir / 'validacion_segmentos.json'), results)
+        write_json(str(out_dir / 'validacion_segmentos.json'), results, durable=False)
     except Exception as err:
         logging.error('[validateSegments] Error validating segments for promo', extra={'promo': promo_id, 'error': err})
 
+# Accented upper-case letters and their plain counterparts.
+_STAGE_TRANS = str.maketrans('ÁÉÍÓÚÑÜ', 'AEIOUNU')
+
 def _normalize_stage_name(name: str) -> str:
     """Normalize stage names by removing accents, underscores and trimming."""
     if not isinstance(name, str):
         return ''
-    # Replace accented characters with their non‑accented counterparts
-    translation = str.maketrans('ÁÉÍÓÚÑÜ', 'AEIOUNU')
-    normalized = name.upper().translate(translation)
-    # Replace underscores with spaces and collapse multiple spaces
-    normalized = normalized.replace('_', ' ').strip()
-    # Replace multiple spaces with single space
-    while '  ' in normalized:
-        normalized = normalized.replace('  ', ' ')
-    return normalized
-
-def _parse_datetime(value: Any) -> Optional[datetime]:  # type: ignore[name-defined]
+    return _normalize_stage_str(name)
+
+@lru_cache(maxsize=512)
+def _normalize_stage_str(name: str) -> str:
+    # Stage names come from a small fixed vocabulary, so memoize the result.
+    # Database rows are coerced with ``str()`` and normalized here directly,
+    # once, when their stage map is built; every later lookup uses that key.
+    normalized = name.upper().translate(_STAGE_TRANS).replace('_', ' ')
+    # Collapse whitespace runs (and trim) in a single pass.  Interning makes
+    # every spelling of a stage share one key object, so lookups against
+    # the literal keys used throughout this module hit on identity.
+    return sys.intern(' '.join(normalized.split()))
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
     """Attempt to parse a date/time string into a datetime object."""
-    from datetime import datetime
     if value is None:
         return None
     if isinstance(value, datetime):
         return value
+    return _parse_datetime_str(str(value))
+
+@lru_cache(maxsize=1024)
+def _parse_datetime_str(value: str) -> Optional[datetime]:
+    # Stage rows repeat the same timestamps, so memoize string parses.
     try:
-        # Try ISO format or 'YYYY-MM-DD HH:MM:SS'
-        return datetime.fromisoformat(str(value).replace('T', ' '))
+        # Try ISO format or 'YYYY-MM-DD HH:MM:SS'; ``fromisoformat`` accepts
+        # either 'T' or a space as the date/time separator.
+        return datetime.fromisoformat(value)
     except Exception:
         # Try splitting date and time manually
         try:
-            return datetime.strptime(str(value), '%Y-%m-%d %H:%M:%S')
+            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
         except Exception:
             return None
 
-def validate_etapas(promo_id: str, cfg: PromoConfig) -> None:
+def _parse_time_str(value: Any) -> Optional[time]:
+    """Parse 'HH:MM' or 'HH:MM:SS' into a ``time``; ``None`` on failure."""
+    if not value:
+        return None
+    return _parse_time_cached(str(value))
+
+@lru_cache(maxsize=256)
+def _parse_time_cached(value: str) -> Optional[time]:
+    try:
+        parts = value.split(':')
+        if len(parts) == 2:
+            h, m = int(parts[0]), int(parts[1])
+            s = 0
+        elif len(parts) == 3:
+            h, m, s = int(parts[0]), int(parts[1]), int(parts[2])
+        else:
+            return None
+        return time(h, m, s)
+    except Exception:
+        return None
+
+# Largest difference between an expected and an actual datetime that
+# still counts as a match (database precision).
+_TOLERANCE = timedelta(seconds=1)
+# Status of a comparison, indexed by whether it matched.
+_STATUS = ('ERROR', 'OK')
+
+def _fmt_dt(dt: datetime) -> str:
+    return dt.strftime('%Y-%m-%d %H:%M:%S')
+
+def _build_dt(reference: datetime, t: time, days_offset: int = 0) -> datetime:
+    """Build a datetime from a reference date and a time of day with a day offset.
+
+    The time is taken from the ``hours`` definition (see
+    ``_compile_hours``) and the date is adjusted by ``days_offset``.
+    """
+    return datetime.combine(_shifted_date(reference.date(), days_offset), t)
+
+@lru_cache(maxsize=2048)
+def _shifted_date(ref_date: date, days_offset: int) -> date:
+    # Segments share a handful of reference dates and offsets.
+    return ref_date + timedelta(days=days_offset)
+
+_RULE_START = 'Inicio según reglas de configuración'
+_RULE_END = 'Fin según reglas de configuración'
+_RULES = (_RULE_START, _RULE_END)
+
+@dataclass(slots=True, frozen=True)
+class _ValidationRow:
+    """One entry of ``validacion_etapas.json``; serialized field by field."""
+
+    etapa: str
+    regla: str
+    valor_esperado: str
+    valor_encontrado: str
+    estado: str
+
+def _validation(stage_name: str, rule: str, expected_dt: Optional[datetime], actual_dt: Optional[datetime]) -> _ValidationRow:
+    """Build one stage validation record comparing expected and actual datetimes."""
+    if expected_dt is None or actual_dt is None:
+        return _ValidationRow(stage_name, rule, 'N/D', 'N/D', 'SKIPPED')
+    diff = abs(actual_dt - expected_dt)
+    return _ValidationRow(
+        stage_name,
+        rule,
+        _fmt_dt(expected_dt),
+        _fmt_dt(actual_dt),
+        _STATUS[diff <= _TOLERANCE],
+    )
+
+# Stage names as stored in the database (normalized) mapped to the keys
+# of the ``durations``/``hours`` configuration, per promotion.
+_RANKING_STAGE_KEYS = {
+    'PLANIFICADO': 'planificacion',
+    'PLANIFICACION': 'planificacion',
+    'PRE EJECUCION': 'preEjecucion',
+    'PRE_EJECUCION': 'preEjecucion',
+    'ACUMULACION': 'acumulacion',
+    'ACUMULACIÓN': 'acumulacion',
+    'VALIDACION': 'validacion',
+    'RECALCULO': 'recalculo',
+    'RESULTADO': 'resultado',
+    'RESULTADO IVIEW': 'resultadoIview',
+    'RESULTADO_IVIEW': 'resultadoIview',
+    'PAGOS FISICO': 'pago',
+    'PAGOS FISICO VENCIDOS': 'vencido',
+    'FINALIZADO': 'finalizado',
+}
+_SORTEOS_STAGE_KEYS = {
+    'PLANIFICADO': 'planificacion',
+    'PLANIFICACION': 'planificacion',
+    'PRE EJECUCION': 'preEjecucion',
+    'PRE_EJECUCION': 'preEjecucion',
+    'ACUMULACION': 'acumulacion',
+    'ACUMULACIÓN': 'acumulacion',
+    'RECALCULO': 'recalculo',
+    'CANJES': 'canjes',
+    'CANJE': 'canjes',
+    'CANJE1': 'canje1',
+    'CANJE 1': 'canje1',
+    'CANJE2': 'canje2',
+    'CANJE 2': 'canje2',
+    'VALIDACION': 'validacion',
+    'RESULTADO': 'resultado',
+    'FINALIZADO': 'finalizado',
+}
+_SALTA_STAGE_KEYS = {
+    'PLANIFICADO': 'planificacion',
+    'PLANIFICACION': 'planificacion',
+    'PRE EJECUCION': 'preEjecucion',
+    'PRE_EJECUCION': 'preEjecucion',
+    'ACUMULACION': 'acumulacion',
+    'ACUMULACIÓN': 'acumulacion',
+    'SORTEO1': 'sorteo1',
+    'SORTEO 1': 'sorteo1',
+    'SORTEO2': 'sorteo2',
+    'SORTEO 2': 'sorteo2',
+    'CANJE1': 'canje1',
+    'CANJE 1': 'canje1',
+    'CANJE2': 'canje2',
+    'CANJE 2': 'canje2',
+    'CANJES': 'canje',
+    'RECALCULO': 'recalculo',
+    'VALIDACION': 'validacion',
+    'RESULTADO': 'resultado',
+    'FINALIZADO': 'finalizado',
+}
+
+def _normalized_keys(stage_keys: Dict[str, str]) -> Mapping[str, str]:
+    # Key the map by the normalized form so lookups with an already
+    # normalized stage name hit directly (e.g. 'PRE_EJECUCION' and
+    # 'ACUMULACIÓN' fold into their plain spellings).
+    return MappingProxyType({_normalize_stage_name(k): v for k, v in stage_keys.items()})
+
+_STAGE_KEY_MAPS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    '17': _normalized_keys(_RANKING_STAGE_KEYS),
+    '18': _normalized_keys(_SORTEOS_STAGE_KEYS),
+    '19': _normalized_keys(_SORTEOS_STAGE_KEYS),
+    '22': _normalized_keys(_SALTA_STAGE_KEYS),
+})
+# Configuration keys of the Salta y Gana sorteo stages.
+_SORTEO_KEYS = frozenset(('sorteo1', 'sorteo2'))
+_EMPTY_MAP: Mapping[str, str] = MappingProxyType({})
+
+# Signature shared by the anchoring rules below: given a configuration key,
+# the actual accumulation start/end and the expectations computed so far,
+# return the reference datetime and the day offset for the stage.
+_Anchor = Tuple[Optional[datetime], int]
+
+def _anchor_common(config_key: str, acum_start: datetime, durations: Dict[str, Any]) -> _Anchor:
+    # Stages anchored on the accumulation start, shared by every promo
+    if config_key in ('planificacion', 'preEjecucion'):
+        return acum_start, (-durations.get('planificacion', 0) if config_key == 'planificacion' else 0)
+    if config_key == 'acumulacion':
+        return acum_start, 0
+    return None, 0
+
+def _anchor_ranking(config_key: str, acum_start: datetime, acum_end: datetime,
+                    expected_starts: Dict[str, datetime], expected_ends: Dict[str, datetime],
+                    durations: Dict[str, Any]) -> _Anchor:
+    """Anchors for ranking (17).
+
+    validacion and recalculo use the accumulation end; resultado starts
+    at the recalculo end; resultadoIview and pago use the accumulation
+    end; vencido starts the day after it; finalizado is anchored on the
+    resultado end.
+    """
+    if config_key in ('validacion', 'recalculo'):
+        return acum_end, durations.get(config_key, 0)
+    if config_key == 'resultado':
+        return expected_ends.get('recalculo') or acum_end, 0
+    if config_key in ('resultadoIview', 'pago'):
+        return acum_end, 0
+    if config_key == 'vencido':
+        return acum_end, 1
+    if config_key == 'finalizado':
+        return expected_ends.get('resultado') or acum_end, 0
+    return _anchor_common(config_key, acum_start, durations)
+
+def _anchor_sorteos(config_key: str, acum_start: datetime, acum_end: datetime,
+                    expected_starts: Dict[str, datetime], expected_ends: Dict[str, datetime],
+                    durations: Dict[str, Any]) -> _Anchor:
+    """Anchors for sorteos (18/19).
+
+    recalculo and canjes use the accumulation end; validacion starts
+    after canjes; resultado uses the validacion start and finalizado
+    the resultado start.
+    """
+    if config_key == 'recalculo':
+        return acum_end, durations.get('recalculo', 0)
+    if config_key == 'canjes':
+        return acum_end, 0
+    if config_key == 'validacion':
+        return expected_ends.get('canjes') or acum_end, durations.get('validacion', 0)
+    if config_key == 'resultado':
+        return expected_starts.get('validacion') or acum_end, durations.get('resultado', 0)
+    if config_key == 'finalizado':
+        return expected_starts.get('resultado') or acum_end, durations.get('finalizado', 0)
+    return _anchor_common(config_key, acum_start, durations)
+
+def _anchor_salta(config_key: str, acum_start: datetime, acum_end: datetime,
+                  expected_starts: Dict[str, datetime], expected_ends: Dict[str, datetime],
+                  durations: Dict[str, Any]) -> _Anchor:
+    """Anchors for Salta y Gana (22).
+
+    Both sorteos start the day after accumulation ends; canje1 begins
+    at the accumulation end and canje2 right after canje1; validacion
+    begins after canje2; resultado uses the validacion start and
+    finalizado the resultado start.
+    """
+    if config_key in ('sorteo1', 'sorteo2'):
+        return acum_end, 1
+    if config_key in ('canje1', 'canje'):
+        return acum_end, durations.get('canje1', 0)
+    if config_key == 'canje2':
+        return expected_ends.get('canje1') or acum_end, durations.get('canje2', 0)
+    if config_key == 'recalculo':
+        return acum_end, durations.get('recalculo', 0)
+    if config_key == 'validacion':
+        return expected_ends.get('canje2') or acum_end, durations.get('validacion', 0)
+    if config_key == 'resultado':
+        return expected_starts.get('validacion') or acum_end, durations.get('resultado', 0)
+    if config_key == 'finalizado':
+        return expected_starts.get('resultado') or acum_end, durations.get('finalizado', 0)
+    return _anchor_common(config_key, acum_start, durations)
+
+def _no_anchor(config_key: str, acum_start: datetime, acum_end: datetime,
+               expected_starts: Dict[str, datetime], expected_ends: Dict[str, datetime],
+               durations: Dict[str, Any]) -> _Anchor:
+    return None, 0
+
+# Configuration keys each stage's anchor reads from the expectations of
+# other stages, per promotion.  Used to evaluate stages in dependency
+# order regardless of the order the database returns them in.
+_STAGE_DEPS: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    '17': MappingProxyType({'resultado': ('recalculo',), 'finalizado': ('resultado',)}),
+    '18': MappingProxyType({'validacion': ('canjes',), 'resultado': ('validacion',), 'finalizado': ('resultado',)}),
+    '19': MappingProxyType({'validacion': ('canjes',), 'resultado': ('validacion',), 'finalizado': ('resultado',)}),
+    '22': MappingProxyType({
+        'canje2': ('canje1',),
+        'validacion': ('canje2',),
+        'resultado': ('validacion',),
+        'finalizado': ('resultado',),
+    }),
+})
+
+def _stage_depths(deps: Mapping[str, Tuple[str, ...]]) -> Mapping[str, int]:
+    """Return the dependency depth of every configuration key in ``deps``.
+
+    Stages with no dependencies have depth 0 (and are simply absent);
+    sorting stages by depth yields a valid evaluation order.
+    """
+    depth: Dict[str, int] = {}
+    for key in TopologicalSorter(deps).static_order():
+        parents = deps.get(key, ())
+        depth[key] = 1 + max(depth[p] for p in parents) if parents else 0
+    return MappingProxyType(depth)
+
+_STAGE_DEPTHS: Mapping[str, Mapping[str, int]] = MappingProxyType({
+    promo: _stage_depths(deps) for promo, deps in _STAGE_DEPS.items()
+})
+
+# Per promotion, every known (normalized) stage name resolved up front to
+# its ``(configuration key, dependency depth)``, so the segment loop needs
+# a single lookup per stage.
+_STAGE_PLANS: Mapping[str, Mapping[str, Tuple[str, int]]] = MappingProxyType({
+    promo: MappingProxyType({
+        name: (key, _STAGE_DEPTHS.get(promo, _EMPTY_MAP).get(key, 0))
+        for name, key in stage_keys.items()
+    })
+    for promo, stage_keys in _STAGE_KEY_MAPS.items()
+})
+# Stages whose end date is a fixed number of days after their start date
+# rather than their configured duration (promo 17 TOP rules).  Every other
+# stage ends ``durations[config_key]`` days after it starts; for ranking's
+# ``vencido`` that gives ``1 + duration`` from the accumulation end.
+_FIXED_END_OFFSETS: Mapping[str, Mapping[str, int]] = MappingProxyType({
+    '17': MappingProxyType({'resultadoIview': 1, 'pago': 1}),
+})
+# Sort key for the ``mapped`` entries built in ``validate_etapas``.
+_BY_DEPTH = itemgetter(3)
+
+_ANCHOR_RULES: Mapping[str, Callable[..., _Anchor]] = MappingProxyType({
+    '17': _anchor_ranking,
+    '18': _anchor_sorteos,
+    '19': _anchor_sorteos,
+    '22': _anchor_salta,
+})
+
+# Parsed ``(start, end)`` times of day per configuration key; either is
+# ``None`` when missing or unparseable.  Keys with neither are omitted.
+_StageHours = Dict[str, Tuple[Optional[time], Optional[time]]]
+
+def _compile_hours(hours_cfg: Any) -> _StageHours:
+    """Parse the ``hours`` definitions of a promotion once, up front."""
+    compiled: _StageHours = {}
+    if not isinstance(hours_cfg, dict):
+        return compiled
+    for config_key, hour_def in hours_cfg.items():
+        if isinstance(hour_def, dict):
+            hours = (_parse_time_str(hour_def.get('start')), _parse_time_str(hour_def.get('end')))
+            if hours != (None, None):
+                compiled[config_key] = hours
+    return compiled
+
+def _schedule_config(promo_id: str, cfg: PromoConfig) -> Tuple[Dict[str, Any], _StageHours]:
+    """Return the ``(durations, hours)`` configuration used for a promotion.
+
+    The hours are returned already parsed (see ``_compile_hours``).
+    """
+    if promo_id in ('18', '19'):
+        # For sorteos the durations are split into common and mode-specific.
+        durations: Dict[str, Any] = {}
+        if 'durations_common' in cfg:
+            durations.update(cfg['durations_common'])
+        if 'durations_mode' in cfg:
+            durations.update(cfg['durations_mode'])
+        hours_cfg: Dict[str, Any] = {}
+        if 'hours_common' in cfg:
+            hours_cfg.update(cfg['hours_common'])
+        return durations, _compile_hours(hours_cfg)
+    if promo_id in ('17', '22'):
+        return cfg.get('durations', {}), _compile_hours(cfg.get('hours', {}))
+    return {}, {}
+
+def validate_etapas(promo_id: str, cfg: PromoConfig, segments: Optional[List[Dict[str, Any]]] = None,
+                    out_root: Optional[Path] = None) -> None:
     """Validate stage chronology, durations and start/end times for each execution segment.
 
     This implementation no longer uses hard‑coded offsets such as "one day before" or
@@ -563,411 +1043,208 @@ def validate_etapas(promo_id: str, cfg: PromoConfig) -> None:
     tolerates a one‑second difference to accommodate database precision.  When a
     stage is missing or its parameters are absent from the configuration, the
     corresponding validations are skipped.
+
+    As with ``validate_segments``, already fetched ``segments`` may be
+    passed in to avoid querying them again and ``out_root`` overrides
+    the report directory.
     """
-    out_dir = _out_dir_for_promo(promo_id)
+    out_dir = _out_dir_for_promo(promo_id, out_root)
     try:
-        segments = querySegmentos(int(promo_id))
+        if segments is None:
+            segments = querySegmentos(int(promo_id))
         if not segments:
             return
         all_results: List[Dict[str, Any]] = []
+        # Translate database stage names into configuration keys and pick
+        # the anchoring rules for this promotion; both are constant.
+        stage_plan = _STAGE_PLANS.get(promo_id, _EMPTY_MAP)
+        anchor = _ANCHOR_RULES.get(promo_id, _no_anchor)
+        durations, stage_hours = _schedule_config(promo_id, cfg)
+        # Days from a stage's start date to its end date
+        end_offsets = {**durations, **_FIXED_END_OFFSETS.get(promo_id, _EMPTY_MAP)}
+        etapas_by_seg = queryEtapasSegBatch(int(seg['id_ejecucion_segmento']) for seg in segments)
         for seg in segments:
             seg_id = int(seg['id_ejecucion_segmento'])
             seg_name = seg.get('nombre_segmento')
-            stage_rows = queryEtapasSeg(seg_id)
+            stage_rows = etapas_by_seg.get(seg_id)
             if not stage_rows:
                 continue
-            # Build a mapping of stage name (normalized) to its data
-            stage_data: Dict[str, Dict[str, Any]] = {}
-            for row in stage_rows:
-                raw_name = row.get('nombre_etapa') or row.get('nombre') or ''
-                name_norm = _normalize_stage_name(str(raw_name))
-                start_dt = _parse_datetime(row.get('fecha_inicio'))
-                end_dt = _parse_datetime(row.get('fecha_fin'))
-                if start_dt is None or end_dt is None:
-                    continue
-                stage_data[name_norm] = {
-                    'start': start_dt,
-                    'end': end_dt,
-                }
-            validations: List[Dict[str, Any]] = []
-            # Helper to format datetime as string
-            def fmt(dt: datetime) -> str:
-                return dt.strftime('%Y-%m-%d %H:%M:%S')
-            # Helper to parse a time string into a datetime.time object.  Accepts
-            # 'HH:MM' or 'HH:MM:SS'.  Returns None on failure.
-            def parse_time_str(value: Any) -> Optional[Any]:
-                from datetime import time
-                if not value:
-                    return None
-                try:
-                    parts = str(value).split(':')
-                    if len(parts) == 2:
-                        h, m = int(parts[0]), int(parts[1])
-                        s = 0
-                    elif len(parts) == 3:
-                        h, m, s = int(parts[0]), int(parts[1]), int(parts[2])
-                    else:
-                        return None
-                    return time(h, m, s)
-                except Exception:
-                    return None
-            # Helper to build a datetime from a reference date and a time string with
-            # a day offset.  The time is taken from the ``hours`` definition and
-            # the date is adjusted by ``days_offset``.  Returns None if time
-            # parsing fails.
-            def build_dt(reference: datetime, time_str: str, days_offset: int = 0) -> Optional[datetime]:
-                t = parse_time_str(time_str)
-                if t is None:
-                    return None
-                dt_date = reference.date() + timedelta(days=days_offset)
-                return datetime.combine(dt_date, t)
-            # Determine the mapping of normalized stage names to keys in the
-            # configuration's durations/hours for the current promotion.  This
-            # allows us to translate database stage names into configuration keys.
-            if promo_id == '17':
-                stage_key_map = {
-                    'PLANIFICADO': 'planificacion',
-                    'PLANIFICACION': 'planificacion',
-                    'PRE EJECUCION': 'preEjecucion',
-                    'PRE_EJECUCION': 'preEjecucion',
-                    'ACUMULACION': 'acumulacion',
-                    'ACUMULACIÓN': 'acumulacion',
-                    'VALIDACION': 'validacion',
-                    'RECALCULO': 'recalculo',
-                    'RESULTADO': 'resultado',
-                    'RESULTADO IVIEW': 'resultadoIview',
-                    'RESULTADO_IVIEW': 'resultadoIview',
-                    'PAGOS FISICO': 'pago',
-                    'PAGOS FISICO VENCIDOS': 'vencido',
-                    'FINALIZADO': 'finalizado',
-                }
-                durations = cfg.get('durations', {})
-                hours_cfg = cfg.get('hours', {})
-            elif promo_id in ('18', '19'):
-                stage_key_map = {
-                    'PLANIFICADO': 'planificacion',
-                    'PLANIFICACION': 'planificacion',
-                    'PRE EJECUCION': 'preEjecucion',
-                    'PRE_EJECUCION': 'preEjecucion',
-                    'ACUMULACION': 'acumulacion',
-                    'ACUMULACIÓN': 'acumulacion',
-                    'RECALCULO': 'recalculo',
-                    'CANJES': 'canjes',
-                    'CANJE': 'canjes',
-                    'CANJE1': 'canje1',
-                    'CANJE 1': 'canje1',
-                    'CANJE2': 'canje2',
-                    'CANJE 2': 'canje2',
-                    'VALIDACION': 'validacion',
-                    'RESULTADO': 'resultado',
-                    'FINALIZADO': 'finalizado',
-                }
-                durations = {}
-                # For sorteos the durations are split into common and mode-specific.
-                if 'durations_common' in cfg:
-                    durations.update(cfg['durations_common'])
-                if 'durations_mode' in cfg:
-                    durations.update(cfg['durations_mode'])
-                hours_cfg = {}
-                if 'hours_common' in cfg:
-                    hours_cfg.update(cfg['hours_common'])
-            elif promo_id == '22':
-                stage_key_map = {
-                    'PLANIFICADO': 'planificacion',
-                    'PLANIFICACION': 'planificacion',
-                    'PRE EJECUCION': 'preEjecucion',
-                    'PRE_EJECUCION': 'preEjecucion',
-                    'ACUMULACION': 'acumulacion',
-                    'ACUMULACIÓN': 'acumulacion',
-                    'SORTEO1': 'sorteo1',
-                    'SORTEO 1': 'sorteo1',
-                    'SORTEO2': 'sorteo2',
-                    'SORTEO 2': 'sorteo2',
-                    'CANJE1': 'canje1',
-                    'CANJE 1': 'canje1',
-                    'CANJE2': 'canje2',
-                    'CANJE 2': 'canje2',
-                    'CANJES': 'canje',
-                    'RECALCULO': 'recalculo',
-                    'VALIDACION': 'validacion',
-                    'RESULTADO': 'resultado',
-                    'FINALIZADO': 'finalizado',
-                }
-                durations = cfg.get('durations', {})
-                hours_cfg = cfg.get('hours', {})
-            else:
-                stage_key_map = {}
-                durations = {}
-                hours_cfg = {}
+            # Build a mapping of stage name (normalized) to its (start, end).
+            # Names are checked first so that segments without an
+            # accumulation stage skip parsing their dates altogether.
+            stage_names = [
+                _normalize_stage_str(str(row.get('nombre_etapa') or row.get('nombre') or ''))
+                for row in stage_rows
+            ]
+            stage_data: Dict[str, Tuple[datetime, datetime]] = {}
+            if 'ACUMULACION' in stage_names:
+                for name_norm, row in zip(stage_names, stage_rows):
+                    start_dt = _parse_datetime(row.get('fecha_inicio'))
+                    end_dt = _parse_datetime(row.get('fecha_fin'))
+                    if start_dt is None or end_dt is None:
+                        continue
+                    stage_data[name_norm] = (start_dt, end_dt)
             # Determine reference datetimes from actual data.  We use the
             # accumulation stage as the anchor for most calculations.
-            acum = stage_data.get('ACUMULACION') or stage_data.get('ACUMULACIÓN')
+            # Names are normalized, so 'ACUMULACIÓN' is stored as 'ACUMULACION'
+            acum = stage_data.get('ACUMULACION')
             if not acum:
                 # Without an accumulation stage the validations cannot proceed.
                 all_results.append({
                     'segmento': seg_id,
                     'nombreSegmento': seg_name,
-                    'validaciones': validations
+                    'validaciones': []
                 })
                 continue
-            acum_start_dt = acum['start']
-            acum_end_dt = acum['end']
+            acum_start_dt, acum_end_dt = acum
             # Compute expected start/end datetimes for each relevant stage based on
             # configuration.  Use actual end times of preceding stages as
             # references when appropriate.  The expected datetimes are stored in
-            # a dictionary keyed by the normalized stage name.
+            # dictionaries keyed by configuration key, so spelling variants of
+            # a stage ('CANJE1', 'CANJE 1') resolve to a single entry.
             expected_starts: Dict[str, datetime] = {}
             expected_ends: Dict[str, datetime] = {}
-            # Helper to add a validation entry
-            def add_validation(stage_name: str, rule: str, expected_dt: Optional[datetime], actual_dt: Optional[datetime]) -> None:
-                if expected_dt is None or actual_dt is None:
-                    validations.append({
-                        'etapa': stage_name,
-                        'regla': rule,
-                        'valor_esperado': 'N/D',
-                        'valor_encontrado': 'N/D',
-                        'estado': 'SKIPPED'
-                    })
-                    return
-                diff = abs((actual_dt - expected_dt).total_seconds())
-                validations.append({
-                    'etapa': stage_name,
-                    'regla': rule,
-                    'valor_esperado': fmt(expected_dt),
-                    'valor_encontrado': fmt(actual_dt),
-                    'estado': 'OK' if diff <= 1 else 'ERROR'
-                })
-            # Build expected schedule for each stage present in stage_data
+            # Map each stage present in stage_data to its configuration key
+            # and total the actual sorteo durations along the way (Salta y Gana)
+            mapped: List[Tuple[str, Tuple[datetime, datetime], str, int]] = []
+            total_sorteo_seconds = 0.0
             for norm_name, times in stage_data.items():
-                # Map the normalized name to the configuration key
-                config_key = stage_key_map.get(norm_name)
-                if not config_key:
+                planned = stage_plan.get(norm_name)
+                if planned:
+                    mapped.append((norm_name, times, *planned))
+                    if planned[0] in _SORTEO_KEYS:
+                        total_sorteo_seconds += (times[1] - times[0]).total_seconds()
+            # Build the expected schedule in dependency order so that a stage
+            # anchored on another one always sees that stage's expectations.
+            schedule: Dict[str, Tuple[Optional[datetime], Optional[datetime]]] = {}
+            for norm_name, times, config_key, _ in sorted(mapped, key=_BY_DEPTH):
+                # Retrieve the (pre-parsed) hour definition for this stage if present
+                hours = stage_hours.get(config_key)
+                if hours is None:
+                    # No hour rules: nothing to validate, and stages anchored
+                    # on this one fall back to its actual times.
+                    expected_starts[config_key], expected_ends[config_key] = times
+                    schedule[norm_name] = (None, None)
                     continue
-                # Retrieve the hour definition for this stage if present
-                hour_def = hours_cfg.get(config_key) if isinstance(hours_cfg, dict) else None
-                start_time_str = hour_def.get('start') if isinstance(hour_def, dict) else None
-                end_time_str = hour_def.get('end') if isinstance(hour_def, dict) else None
-                # Determine the reference datetime for this stage.  By default
-                # stages refer to the accumulation start (planificacion, preEjecucion)
-                # or accumulation end (validacion, recalculo) or canje end for
-                # subsequent stages.  For ranking, validacion and recalculo use
-                # accumulation end; resultado uses validacion start; resultadoIview
-                # uses validacion start; pago uses accumulation end; vencido uses
-                # accumulation end; finalizado uses resultado start.  For sorteos
-                # (18/19), validacion uses canjes end; recalc uses accumulation end;
-                # resultado uses validacion start; finalizado uses resultado start.
-                # For Salta y Gana, validacion uses canje2 end; recalculo uses
-                # accumulation end; resultado uses validacion start; finalizado uses
-                # resultado start.
-                ref_dt: Optional[datetime] = None
-                day_offset = 0
-                # Determine base for ranking
-                if promo_id == '17':
-                    if config_key in ('planificacion', 'preEjecucion'):
-                        ref_dt = acum_start_dt
-                        day_offset = -durations.get('planificacion', 0) if config_key == 'planificacion' else 0
-                    elif config_key == 'acumulacion':
-                        ref_dt = acum_start_dt
-                        day_offset = 0
-                    elif config_key in ('validacion', 'recalculo'):
-                        ref_dt = acum_end_dt
-                        day_offset = durations.get(config_key, 0)
-                    elif config_key == 'resultado':
-                        # resultado: start at recalculo.end; end = start + durations.resultado
-                        recalc_end = expected_ends.get('RECALCULO')
-                        if recalc_end:
-                            ref_dt = recalc_end
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = 0
-                    elif config_key == 'resultadoIview':
-                        # resultadoIview: start at acumulacion.end; end = acumulacion.end + 1 day
-                        ref_dt = acum_end_dt
-                        day_offset = 0
-                    elif config_key == 'pago':
-                        # pago: start at acumulacion.end; end = acumulacion.end + 1 day
-                        ref_dt = acum_end_dt
-                        day_offset = 0
-                    elif config_key == 'vencido':
-                        # vencido: start = acumulacion.end + 1 day; end = start + durations.vencido
-                        ref_dt = acum_end_dt
-                        day_offset = 1
-                    elif config_key == 'finalizado':
-                        # finalizado: start & end anchored on resultado.end
-                        res_end = expected_ends.get('RESULTADO')
-                        if res_end:
-                            ref_dt = res_end
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = 0
-                elif promo_id in ('18', '19'):
-                    # Sorteos: use accumulation end for recalc and canjes; canjes for validacion;
-                    # validacion for resultado; resultado for finalizado
-                    if config_key in ('planificacion', 'preEjecucion'):
-                        ref_dt = acum_start_dt
-                        day_offset = -durations.get('planificacion', 0) if config_key == 'planificacion' else 0
-                    elif config_key == 'acumulacion':
-                        ref_dt = acum_start_dt
-                        day_offset = 0
-                    elif config_key == 'recalculo':
-                        ref_dt = acum_end_dt
-                        day_offset = durations.get('recalculo', 0)
-                    elif config_key == 'canjes':
-                        ref_dt = acum_end_dt
-                        day_offset = 0
-                    elif config_key == 'validacion':
-                        # validacion starts after canjes end
-                        canj_end = expected_ends.get('CANJES') or expected_ends.get('CANJE')
-                        if canj_end:
-                            ref_dt = canj_end
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = durations.get('validacion', 0)
-                    elif config_key == 'resultado':
-                        val_start = expected_starts.get('VALIDACION')
-                        if val_start:
-                            ref_dt = val_start
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = durations.get('resultado', 0)
-                    elif config_key == 'finalizado':
-                        res_start = expected_starts.get('RESULTADO')
-                        if res_start:
-                            ref_dt = res_start
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = durations.get('finalizado', 0)
-                elif promo_id == '22':
-                    # Salta y Gana: specific anchors for stages
-                    if config_key in ('planificacion', 'preEjecucion'):
-                        ref_dt = acum_start_dt
-                        day_offset = -durations.get('planificacion', 0) if config_key == 'planificacion' else 0
-                    elif config_key == 'acumulacion':
-                        ref_dt = acum_start_dt
-                        day_offset = 0
-                    elif config_key in ('sorteo1', 'sorteo2'):
-                        # Sorteos start the day after accumulation ends
-                        ref_dt = acum_end_dt
-                        # sorteo1 begins 1 day after; sorteo2 shares same day as sorteo1
-                        day_offset = 1
-                    elif config_key in ('canje1', 'canje2', 'canje'):
-                        # canje1 begins at accumulation end; canje2 begins right after canje1
-                        if config_key == 'canje1' or config_key == 'canje':
-                            ref_dt = acum_end_dt
-                            day_offset = durations.get('canje1', 0)
-                        else:  # canje2
-                            # start after canje1 ends
-                            canje1_end = expected_ends.get('CANJE1') or expected_ends.get('CANJE 1') or expected_ends.get('CANJE')
-                            if canje1_end:
-                                ref_dt = canje1_end
-                            else:
-                                ref_dt = acum_end_dt
-                            day_offset = durations.get('canje2', 0)
-                    elif config_key == 'recalculo':
-                        ref_dt = acum_end_dt
-                        day_offset = durations.get('recalculo', 0)
-                    elif config_key == 'validacion':
-                        # begins after canje2 ends
-                        canje2_end = expected_ends.get('CANJE2') or expected_ends.get('CANJE 2') or expected_ends.get('CANJE')
-                        if canje2_end:
-                            ref_dt = canje2_end
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = durations.get('validacion', 0)
-                    elif config_key == 'resultado':
-                        val_start = expected_starts.get('VALIDACION')
-                        if val_start:
-                            ref_dt = val_start
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = durations.get('resultado', 0)
-                    elif config_key == 'finalizado':
-                        res_start = expected_starts.get('RESULTADO')
-                        if res_start:
-                            ref_dt = res_start
-                        else:
-                            ref_dt = acum_end_dt
-                        day_offset = durations.get('finalizado', 0)
+                start_t, end_t = hours
+                # Determine the reference datetime and day offset for this
+                # stage from the promotion's anchoring rules (``_anchor_*``).
+                ref_dt, day_offset = anchor(config_key, acum_start_dt, acum_end_dt, expected_starts, expected_ends, durations)
                 # Only build expectations if both hours and reference are available
-                if ref_dt is not None and start_time_str:
-                    expected_start_dt = build_dt(ref_dt, start_time_str, day_offset)
+                if ref_dt is not None and start_t is not None:
+                    expected_start_dt = _build_dt(ref_dt, start_t, day_offset)
                 else:
                     expected_start_dt = None
-                if ref_dt is not None and end_time_str is not None:
+                if ref_dt is not None and end_t is not None:
                     # End may have the same day_offset as start plus the duration for this stage
-                    # End offset can be stage-specific (promo 17 TOP rules)
-                    if promo_id == '17':
-                        if config_key == 'resultado':
-                            end_offset = durations.get('resultado', 0)
-                        elif config_key == 'resultadoIview':
-                            end_offset = 1
-                        elif config_key == 'pago':
-                            end_offset = 1
-                        elif config_key == 'vencido':
-                            # start was +1; adding durations gives (1 + dur)
-                            end_offset = durations.get('vencido', 0)
-                        elif config_key in ('validacion','recalculo','finalizado','acumulacion','planificacion','preEjecucion'):
-                            end_offset = durations.get(config_key, 0)
-                        else:
-                            end_offset = durations.get(config_key, 0)
-                    else:
-                        end_offset = durations.get(config_key, 0)
-                    expected_end_dt = build_dt(ref_dt, end_time_str, day_offset + end_offset)
+                    expected_end_dt = _build_dt(ref_dt, end_t, day_offset + end_offsets.get(config_key, 0))
                 else:
                     expected_end_dt = None
                 # Record expectations so subsequent stages can reference them
-                expected_starts[norm_name] = expected_start_dt if expected_start_dt else times['start']
-                expected_ends[norm_name] = expected_end_dt if expected_end_dt else times['end']
-                # Compare actual start/end with expected ones
-                if expected_start_dt:
-                    add_validation(norm_name, 'Inicio según reglas de configuración', expected_start_dt, times['start'])
-                if expected_end_dt:
-                    add_validation(norm_name, 'Fin según reglas de configuración', expected_end_dt, times['end'])
+                expected_starts[config_key] = expected_start_dt if expected_start_dt else times[0]
+                expected_ends[config_key] = expected_end_dt if expected_end_dt else times[1]
+                schedule[norm_name] = (expected_start_dt, expected_end_dt)
+            # Compare actual start/end with expected ones, in data order; the
+            # list is built in a single comprehension rather than appended to.
+            validations: List[_ValidationRow] = [
+                _validation(norm_name, rule, expected_dt, actual_dt)
+                for norm_name, times, _, _ in mapped
+                for rule, expected_dt, actual_dt in zip(_RULES, schedule[norm_name], times)
+                if expected_dt
+            ]
             # Additional validation: for Salta y Gana ensure that la validación
             # dura lo mismo que la suma de los sorteos
             if promo_id == '22':
-                # Compute total sorteo duration from actual data
-                total_sorteo_seconds = 0.0
-                for name, key in [('SORTEO1', 'sorteo1'), ('SORTEO 1', 'sorteo1'), ('SORTEO2', 'sorteo2'), ('SORTEO 2', 'sorteo2')]:
-                    sd = stage_data.get(_normalize_stage_name(name))
-                    if sd:
-                        total_sorteo_seconds += (sd['end'] - sd['start']).total_seconds()
                 val_stage = stage_data.get('VALIDACION')
                 if val_stage and total_sorteo_seconds > 0:
-                    val_seconds = (val_stage['end'] - val_stage['start']).total_seconds()
-                    validations.append({
-                        'etapa': 'VALIDACION',
-                        'regla': 'Duración igual a la suma de los SORTEOS',
-                        'valor_esperado': f"{total_sorteo_seconds} segundos",
-                        'valor_encontrado': f"{val_seconds} segundos",
-                        'estado': 'OK' if abs(val_seconds - total_sorteo_seconds) <= 1 else 'ERROR'
-                    })
+                    val_seconds = (val_stage[1] - val_stage[0]).total_seconds()
+                    validations.append(_ValidationRow(
+                        'VALIDACION',
+                        'Duración igual a la suma de los SORTEOS',
+                        f"{total_sorteo_seconds} segundos",
+                        f"{val_seconds} segundos",
+                        _STATUS[abs(val_seconds - total_sorteo_seconds) <= 1],
+                    ))
             all_results.append({
                 'segmento': seg_id,
                 'nombreSegmento': seg_name,
                 'validaciones': validations
             })
-        write_json(str(out_dir / 'validacion_etapas.json'), all_results)
+        write_json(str(out_dir / 'validacion_etapas.json'), all_results, durable=False)
     except Exception as err:
         logging.error('[validateEtapas] Error validating etapas for promo', extra={'promo': promo_id, 'error': err})
 
 def validate_all(promos: Optional[List[str]] = None) -> None:
+    """Validate all promotions or a subset specified by the caller.
 
-    validations_root = Path("pages/Brief/Validaciones")
-    if validations_root.exists():
-        shutil.rmtree(validations_root)
-    validations_root.mkdir(parents=True, exist_ok=True)
+    Promotions run concurrently on threads rather than processes: the
+    work is dominated by database round trips, and the workers share
+    the connection pools and the per-run query cache, neither of which
+    survives a process boundary.
 
-    """Validate all promotions or a subset specified by the caller."""
-    cfg = load_ejecucion_config()
+    Reports are written to a staging directory that replaces
+    ``pages/Brief/Validaciones`` only once every promo has finished, so
+    readers never see a half-written set of reports.
+    """
+    staging = _VALIDATIONS_ROOT.with_name(_VALIDATIONS_ROOT.name + '.new')
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    reset_query_cache()
+    # The validators only read the configuration, so skip the defensive
+    # deep copy made by ``load_ejecucion_config``.
+    cfg = _shared_config()
     list_to_validate = promos if promos and promos[0] != 'all' else list(cfg.keys())
     logging.info('[validateAll] Promos to validate', extra={'list': list_to_validate})
+    jobs: List[tuple] = []
     for promo_id in list_to_validate:
         # Skip unknown IDs gracefully
         promo_cfg = cfg.get(promo_id)
         if not promo_cfg:
             logging.warning(f"Promo ID {promo_id} not found in config; skipping")
             continue
-        validate_segments(promo_id, promo_cfg)
-        # After validating segments, validate the stage durations and times
-        validate_etapas(promo_id, promo_cfg)
\ No newline at end of file
+        jobs.append((promo_id, promo_cfg))
+    if not jobs:
+        _publish_validations(staging)
+        return
+    # Promotions are independent and I/O bound, so overlap their database
+    # round trips.  Each promo writes only to its own output directory.
+    # Every promo may itself hold up to ``_SEGMENT_TABLE_COUNT`` pooled
+    # connections at once (see ``querySegmentTables``), so size the promo
+    # pool to keep the total within ``DB_POOL_SIZE``.
+    max_workers = max(1, min(len(jobs), config.DB_POOL_SIZE // _SEGMENT_TABLE_COUNT))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_validate_promo, promo_id, promo_cfg, staging) for promo_id, promo_cfg in jobs]
+        for future in as_completed(futures):
+            future.result()
+    flush_reports()
+    _publish_validations(staging)
+
+def _publish_validations(staging: Path) -> None:
+    """Swap ``staging`` in as the reports directory.
+
+    The previous reports are moved aside with a rename and deleted on a
+    background thread, so publishing costs two renames regardless of how
+    many files the old run left behind.  The reports directory is missing
+    between the two renames.
+    """
+    # A name unique to this run, so a cleanup thread still deleting the
+    # reports of a previous run never races with this one.
+    stamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
+    old = _VALIDATIONS_ROOT.with_name(f'{_VALIDATIONS_ROOT.name}.old-{os.getpid()}-{stamp}')
+    if _VALIDATIONS_ROOT.exists():
+        os.replace(_VALIDATIONS_ROOT, old)
+    os.replace(staging, _VALIDATIONS_ROOT)
+    fsync_dir(str(_VALIDATIONS_ROOT.parent))
+    threading.Thread(target=shutil.rmtree, args=(old,), kwargs={'ignore_errors': True},
+                     name='validaciones-cleanup').start()
+
+def _validate_promo(promo_id: str, promo_cfg: PromoConfig, out_root: Optional[Path] = None) -> None:
+    # Both validators work on the same segment list; fetch it once.
+    try:
+        segments = querySegmentos(int(promo_id))
+    except Exception as err:
+        logging.error('[validateAll] Error fetching segments for promo', extra={'promo': promo_id, 'error': err})
+        return
+    validate_segments(promo_id, promo_cfg, segments, out_root)
+    # After validating segments, validate the stage durations and times
+    validate_etapas(promo_id, promo_cfg, segments, out_root)
\ No newline at end of file
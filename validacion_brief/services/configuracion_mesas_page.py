@@ -9,25 +9,43 @@ against rows returned from the mesas database.
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ..compat.database_connection206 import query_fechas_mesas
 from ..infra.reporting.json_reporter import ensure_dir, write_json
 
 
+_MESAS_CONFIG_PATH = Path('pages/Brief/JsonGenerales/mesas_config.json')
+
+
 def load_mesas_config() -> Dict[str, Any]:
     """Load mesas configuration from the JSON file.
 
     The file may either be an object with a ``mesas`` array or a raw array.
     The function normalises the structure into a dictionary with a
     ``mesas`` key.
+
+    The parsed file is cached until its modification time changes; a
+    deep copy is returned so callers may mutate it freely.
     """
-    path = Path('pages/Brief/JsonGenerales/mesas_config.json')
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    path = _MESAS_CONFIG_PATH
+    return copy.deepcopy(_load_mesas_config_impl(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=1)
+def _load_mesas_config_impl(path: str, mtime_ns: int) -> Dict[str, Any]:
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     if isinstance(data, dict) and 'mesas' in data:
         return data
     # If it's a list, wrap it into {mesas: [...]}
@@ -40,28 +58,30 @@ def validate_mesas_fechas() -> None:
     """Validate that mesas start/end dates match expected values."""
     expected = load_mesas_config()
     rows = query_fechas_mesas()
-    # Build a map from segmento/codigo to expected start and end times
-    exp_map: Dict[str, Dict[str, Any]] = {}
+    # Build a map from segmento/codigo to expected start and end times,
+    # keeping their string forms (what rows are compared against) alongside
+    exp_map: Dict[str, Tuple[Dict[str, Any], Tuple[str, str]]] = {}
     for mesa in expected.get('mesas', []):
         # Accept both 'segmento' and 'codigo'
         segment_id = str(mesa.get('segmento') or mesa.get('codigo'))
         start = mesa.get('inicio') or mesa.get('dia_inicio')
         end = mesa.get('fin') or mesa.get('dia_fin')
-        exp_map[segment_id] = {'inicio': start, 'fin': end}
+        exp_map[segment_id] = ({'inicio': start, 'fin': end}, (str(start), str(end)))
     diffs: List[Dict[str, Any]] = []
     for r in rows:
         seg = str(r.get('segmento') or r.get('codigo') or r.get('id') or '')
-        expected_entry = exp_map.get(seg)
-        if not expected_entry:
+        match = exp_map.get(seg)
+        if match is None:
             diffs.append({'segmento': seg, 'status': 'ERROR', 'reason': 'Segmento no esperado'})
             continue
-        ok_inicio = str(expected_entry['inicio']) == str(r.get('inicio'))
-        ok_fin = str(expected_entry['fin']) == str(r.get('fin'))
-        if not ok_inicio or not ok_fin:
+        expected_entry, expected_str = match
+        inicio = r.get('inicio')
+        fin = r.get('fin')
+        if (str(inicio), str(fin)) != expected_str:
             diffs.append({
                 'segmento': seg,
                 'expected': expected_entry,
-                'found': {'inicio': r.get('inicio'), 'fin': r.get('fin')},
+                'found': {'inicio': inicio, 'fin': fin},
                 'status': 'ERROR',
             })
     status = 'ERROR' if diffs else 'OK'
@@ -11,116 +11,248 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ..infra.notifications.email import send_html_email
 
+# Report values are plain text; escape them once when rendering HTML.
+_HTML_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Fixed envelope of the summary table around the per-promotion rows.
+_HTML_PREFIX = (
+    '<div style="font-family:Arial,Helvetica,sans-serif">'
+    '<h3>Resumen de validaciones BRIEF</h3>'
+    '<table border="1" cellspacing="0" cellpadding="6">'
+    '<tr><th>Promoción</th><th>Estado</th><th>Errores</th><th>Detalles</th></tr>'
+)
+_HTML_SUFFIX = '</table></div>'
+
+# Status column text; any unknown status is shown as skipped.
+_STATUS_DISPLAY = {'OK': '✅ OK', 'ERROR': '❌ ERROR', 'SKIPPED': '⏭️ SKIPPED'}
+
+# Map human-friendly category names to the keys used in per-segment results
+_CAT_TO_KEY = {
+    'Multiplicador': 'multiplicador',
+    'Equivalencias': 'equivalencias',
+    'Configuraciones': 'configuraciones',
+    'Premios': 'premios',
+    'Etapas': 'etapas',
+}
+# (category, key, legacy per-category summary file)
+_CAT_FILES = tuple((cat, key, f"validacion_{key}.json") for cat, key in _CAT_TO_KEY.items())
+# Every file ``build_summary`` reads from a promotion directory
+_FILE_NAMES = frozenset(
+    [fname for _, _, fname in _CAT_FILES] + ['validacion_segmentos.json', 'validacion_etapas.json']
+)
+
+# Reports at least this large are parsed straight from a memory map
+# (with ``orjson``) instead of being read into a ``bytes`` copy first.
+_MMAP_THRESHOLD = 64 * 1024
 
-def _read_json(path: Path) -> Optional[Any]:
+
+def _read_fd(fd: int, size: int) -> bytes:
+    # A single ``os.read`` of the stat size covers the file; asking for
+    # one extra byte detects a file that grew since it was listed.
+    data = os.read(fd, size + 1)
+    if len(data) <= size:
+        return data
+    chunks = [data]
+    while chunk := os.read(fd, 1 << 16):
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def _read_json(path: str, size: int = 0) -> Optional[Any]:
+    """Parse a small JSON report, returning ``None`` if it cannot be read.
+
+    Files go through a raw descriptor instead of a buffered file object,
+    since most reports fit in one ``os.read``.
+    """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if orjson is not None and size >= _MMAP_THRESHOLD:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            raw = _read_fd(fd, size)
+        finally:
+            os.close(fd)
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return None
 
 
-def build_summary() -> Tuple[str, List[Dict[str, Any]]]:
-    """Build an HTML summary of all promotion validations.
+@lru_cache(maxsize=4096)
+def _read_json_cached(path: str, mtime_ns: int, size: int) -> Optional[Any]:
+    # Keyed on the file's mtime and size so a rewritten report is parsed
+    # again; the result is shared between calls and must not be mutated.
+    return _read_json(path, size)
 
-    This implementation supports both legacy per-category summary files
-    (``validacion_multiplicador.json`` etc.) and the newer per-segment
-    validation lists (``validacion_segmentos.json`` and ``validacion_etapas.json``).
-    It produces an overall status per promotion and collates error messages
-    from individual segments into the details column.
 
-    Returns a tuple of (html, rows).  Each row is a dict with keys
-    ``promo``, ``status``, ``errors`` and ``details``.
+def _read_dir(d: str, names: AbstractSet[str]) -> Dict[str, Any]:
+    """Parse the summary files ``names`` that exist in ``d``.
+
+    A single ``os.scandir`` lists the directory, so files a promotion
+    does not have cost no ``open`` call and no exception.  Unchanged
+    files are served from the parse cache, which keeps repeated
+    ``send_summary_email`` calls from re-parsing every report.
     """
-    base = Path('pages/Brief/Validaciones')
-    logging.info('[buildSummary] Reading summaries from', extra={'base': str(base)})
+    loaded: Dict[str, Any] = {}
     try:
-        dirs = [d for d in base.iterdir() if d.is_dir()]
-    except Exception:
-        dirs = []
-    rows: List[Dict[str, Any]] = []
-    # Map human-friendly category names to the keys used in per-segment results
-    cat_to_key = {
-        'Multiplicador': 'multiplicador',
-        'Equivalencias': 'equivalencias',
-        'Configuraciones': 'configuraciones',
-        'Premios': 'premios',
-        'Etapas': 'etapas',
+        with os.scandir(d) as it:
+            for e in it:
+                if e.name not in names or not e.is_file():
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                loaded[e.name] = _read_json_cached(e.path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    return loaded
+
+
+def _summarise_promo(name: str, files: Dict[str, Any], include_skipped: bool = True) -> Dict[str, Any]:
+    """Summarise one promotion from its parsed ``validacion_*.json`` files.
+
+    Without ``include_skipped`` a promotion whose categories were all
+    SKIPPED gets empty details, since its row will not be shown.
+    """
+    category_statuses: Dict[str, Optional[str]] = {}
+    # Message lists are only created for categories that have messages
+    category_msgs: Dict[str, List[str]] = {}
+    has_error = False
+    error_count = 0
+    all_skipped = True
+    # First, attempt to read per-category summary files (legacy format)
+    for cat, key, fname in _CAT_FILES:
+        j = files.get(fname)
+        if isinstance(j, dict) and 'status' in j:
+            status = j.get('status', 'SKIPPED')
+            details = j.get('details') or ''
+            category_statuses[cat] = status
+            # If details present, split by semicolon or newline to messages
+            if isinstance(details, str) and details:
+                category_msgs[cat] = [details.strip()]
+            if status != 'SKIPPED':
+                all_skipped = False
+            if status == 'ERROR':
+                has_error = True
+                error_count += 1
+            continue
+        # Otherwise we'll compute status from per-segment results later
+        category_statuses[cat] = None  # mark to compute later
+    # Load per-segment results if needed
+    seg_data = files.get('validacion_segmentos.json')
+    seg_list: Optional[List[Dict[str, Any]]] = seg_data if isinstance(seg_data, list) else None
+    # validacion_etapas.json: list of per-segment stage validations
+    etapas_data = files.get('validacion_etapas.json')
+    etapas_list: Optional[List[Dict[str, Any]]] = (
+        etapas_data if isinstance(etapas_data, list) else None
+    )
+    # Group the per-segment results of the categories still undecided in
+    # one pass over the segments, as (segment item, category data) pairs
+    per_cat: Dict[str, List[Tuple[Dict[str, Any], Dict[str, Any]]]] = {
+        key: [] for cat, key in _CAT_TO_KEY.items() if category_statuses[cat] is None
     }
-    for d in dirs:
-        category_statuses: Dict[str, Optional[str]] = {}
-        category_msgs: Dict[str, List[str]] = {cat: [] for cat in cat_to_key}
-        has_error = False
-        error_count = 0
-        all_skipped = True
-        # First, attempt to read per-category summary files (legacy format)
-        for cat, key in cat_to_key.items():
-            fname = f"validacion_{key}.json"
-            j = _read_json(d / fname)
-            if isinstance(j, dict) and 'status' in j:
-                status = j.get('status', 'SKIPPED')
-                details = j.get('details') or ''
-                category_statuses[cat] = status
-                # If details present, split by semicolon or newline to messages
-                if isinstance(details, str) and details:
-                    category_msgs[cat].append(details.strip())
-                if status != 'SKIPPED':
-                    all_skipped = False
-                if status == 'ERROR':
-                    has_error = True
-                    error_count += 1
-                continue
-            # Otherwise we'll compute status from per-segment results later
-            category_statuses[cat] = None  # mark to compute later
-        # Load per-segment results if needed
-        seg_list: Optional[List[Dict[str, Any]]] = None
-        seg_path = d / 'validacion_segmentos.json'
-        if seg_path.exists():
-            try:
-                with open(seg_path, 'r', encoding='utf-8') as fh:
-                    seg_data = json.load(fh)
-                if isinstance(seg_data, list):
-                    seg_list = seg_data
-            except Exception:
-                seg_list = None
-        # validacion_etapas.json: list of per-segment stage validations
-        etapas_list: Optional[List[Dict[str, Any]]] = None
-        etapas_path = d / 'validacion_etapas.json'
-        if etapas_path.exists():
-            try:
-                with open(etapas_path, 'r', encoding='utf-8') as fh:
-                    etapas_data = json.load(fh)
-                if isinstance(etapas_data, list):
-                    etapas_list = etapas_data
-            except Exception:
-                etapas_list = None
-        # Derive statuses and messages from per-segment results for categories
-        for cat, key in cat_to_key.items():
-            # Skip categories already determined from legacy summary
-            if category_statuses[cat] is not None:
-                continue
-            # If there are no segments data, mark as SKIPPED
-            if key != 'etapas' and not seg_list:
-                category_statuses[cat] = 'SKIPPED'
-                continue
-            if key == 'etapas' and not (seg_list or etapas_list):
-                category_statuses[cat] = 'SKIPPED'
-                continue
-            any_ok = False
-            any_error = False
-            # Temporary list to gather messages for this category
-            tmp_msgs: List[str] = []
-            if key != 'etapas' and seg_list:
-                for item in seg_list:
-                    seg_id = item.get('segmento') or item.get('segmentId') or item.get('id')
-                    cat_data = item.get(key)
-                    if not isinstance(cat_data, dict):
+    if seg_list and per_cat:
+        for item in seg_list:
+            item_get = item.get
+            for key, pairs in per_cat.items():
+                cat_data = item_get(key)
+                if isinstance(cat_data, dict):
+                    pairs.append((item, cat_data))
+    # Derive statuses and messages from per-segment results for categories
+    for cat, key in _CAT_TO_KEY.items():
+        # Skip categories already determined from legacy summary
+        if category_statuses[cat] is not None:
+            continue
+        # If there are no segments data, mark as SKIPPED
+        if key != 'etapas' and not seg_list:
+            category_statuses[cat] = 'SKIPPED'
+            continue
+        if key == 'etapas' and not (seg_list or etapas_list):
+            category_statuses[cat] = 'SKIPPED'
+            continue
+        any_ok = False
+        any_error = False
+        # Temporary list to gather messages for this category
+        tmp_msgs: List[str] = []
+        if key != 'etapas' and seg_list:
+            for item, cat_data in per_cat[key]:
+                cat_get = cat_data.get
+                status = cat_get('status')
+                if status == 'OK':
+                    any_ok = True
+                elif status == 'ERROR':
+                    any_error = True
+                    # Build a human friendly message describing the error
+                    item_get = item.get
+                    prefix = f"Seg {item_get('segmento') or item_get('segmentId') or item_get('id')}: "
+                    if key == 'multiplicador':
+                        tmp_msgs.append(
+                            f"{prefix}esperado {cat_get('expected')}, encontrado {cat_get('found')}"
+                        )
+                    elif key == 'equivalencias':
+                        tmp_msgs.append(prefix + 'diferencias en equivalencias')
+                    elif key == 'configuraciones':
+                        diffs = cat_get('diffs')
+                        if diffs:
+                            # The segment prefix heads the joined diffs as one string
+                            tmp_msgs.append(prefix + ', '.join([
+                                f"{k}: esp {v['expected']}, obt {v['found']}"
+                                for k, v in diffs.items()
+                            ]))
+                        else:
+                            tmp_msgs.append(prefix + 'diferencias en configuraciones')
+                    elif key == 'premios':
+                        tmp_msgs.append(prefix + 'diferencias en premios')
+        elif key == 'etapas':
+            # Derive from per-stage validations and segments etapas status
+            if etapas_list:
+                for item in etapas_list:
+                    seg_id = item.get('segmento')
+                    validaciones = item.get('validaciones')
+                    if not isinstance(validaciones, list):
                         continue
+                    seg_any_error = False
+                    for v in validaciones:
+                        estado = v.get('estado')
+                        if estado == 'ERROR':
+                            seg_any_error = True
+                            etapa = v.get('etapa') or v.get('nombre_etapa')
+                            regla = v.get('regla')
+                            exp_val = v.get('valor_esperado')
+                            found_val = v.get('valor_encontrado')
+                            # Include stage name in the message
+                            if etapa:
+                                tmp_msgs.append(
+                                    f"Seg {seg_id} - {etapa}: {regla} (esp {exp_val}, obt {found_val})"
+                                )
+                            else:
+                                tmp_msgs.append(
+                                    f"Seg {seg_id}: {regla} (esp {exp_val}, obt {found_val})"
+                                )
+                    if seg_any_error:
+                        any_error = True
+                    elif validaciones:
+                        any_ok = True
+            # If no detailed etapas validations or none had errors, fall back to segment etapas status
+            if not any_error and seg_list:
+                for item, cat_data in per_cat[key]:
+                    seg_id = item.get('segmento')
                     status = cat_data.get('status')
                     if status == 'SKIPPED':
                         continue
@@ -128,147 +260,140 @@ def build_summary() -> Tuple[str, List[Dict[str, Any]]]:
                         any_ok = True
                     elif status == 'ERROR':
                         any_error = True
-                        # Build a human friendly message describing the error
-                        if key == 'multiplicador':
-                            exp = cat_data.get('expected')
-                            found = cat_data.get('found')
-                            tmp_msgs.append(f"Seg {seg_id}: esperado {exp}, encontrado {found}")
-                        elif key == 'equivalencias':
-                            tmp_msgs.append(f"Seg {seg_id}: diferencias en equivalencias")
-                        elif key == 'configuraciones':
-                            diffs = cat_data.get('diffs') or {}
-                            if diffs:
-                                diff_details = ', '.join([
-                                    f"{k}: esp {v['expected']}, obt {v['found']}"
-                                    for k, v in diffs.items()
-                                ])
-                                tmp_msgs.append(f"Seg {seg_id}: {diff_details}")
-                            else:
-                                tmp_msgs.append(f"Seg {seg_id}: diferencias en configuraciones")
-                        elif key == 'premios':
-                            tmp_msgs.append(f"Seg {seg_id}: diferencias en premios")
-            elif key == 'etapas':
-                # Derive from per-stage validations and segments etapas status
-                if etapas_list:
-                    for item in etapas_list:
-                        seg_id = item.get('segmento')
-                        validaciones = item.get('validaciones')
-                        if not isinstance(validaciones, list):
-                            continue
-                        seg_any_error = False
-                        for v in validaciones:
-                            estado = v.get('estado')
-                            if estado == 'ERROR':
-                                seg_any_error = True
-                                etapa = v.get('etapa') or v.get('nombre_etapa')
-                                regla = v.get('regla')
-                                exp_val = v.get('valor_esperado')
-                                found_val = v.get('valor_encontrado')
-                                # Include stage name in the message
-                                if etapa:
-                                    tmp_msgs.append(
-                                        f"Seg {seg_id} - {etapa}: {regla} (esp {exp_val}, obt {found_val})"
-                                    )
-                                else:
-                                    tmp_msgs.append(
-                                        f"Seg {seg_id}: {regla} (esp {exp_val}, obt {found_val})"
-                                    )
-                        if seg_any_error:
-                            any_error = True
-                        elif validaciones:
-                            any_ok = True
-                # If no detailed etapas validations or none had errors, fall back to segment etapas status
-                if not any_error and seg_list:
-                    for item in seg_list:
-                        seg_id = item.get('segmento')
-                        cat_data = item.get('etapas')
-                        if not isinstance(cat_data, dict):
-                            continue
-                        status = cat_data.get('status')
-                        if status == 'SKIPPED':
-                            continue
-                        if status == 'OK':
-                            any_ok = True
-                        elif status == 'ERROR':
-                            any_error = True
-                            missing = cat_data.get('missing') or []
-                            extra = cat_data.get('extra') or []
-                            parts = []
-                            if missing:
-                                parts.append(f"faltan {', '.join(missing)}")
-                            if extra:
-                                parts.append(f"sobran {', '.join(extra)}")
-                            if parts:
-                                tmp_msgs.append(f"Seg {seg_id}: {' y '.join(parts)}")
-                            else:
-                                tmp_msgs.append(f"Seg {seg_id}: diferencias en etapas")
-            # Determine overall status for the category
-            if any_error:
-                status = 'ERROR'
-            elif any_ok:
-                status = 'OK'
-            else:
-                status = 'SKIPPED'
-            category_statuses[cat] = status
-            if tmp_msgs:
-                category_msgs[cat].extend(tmp_msgs)
-            if status != 'SKIPPED':
-                all_skipped = False
-            if status == 'ERROR':
-                has_error = True
-                error_count += 1
-        # Build the detail string combining statuses and messages
-        # Format as an unordered list for better readability
-        list_items: List[str] = []
-        for cat, status in category_statuses.items():
-            msgs = category_msgs.get(cat) or []
-            if msgs:
-                # Join multiple messages with semicolon for consistency inside the list item
-                msg_str = '; '.join(msgs)
-                list_items.append(
-                    f"<li><strong>{cat}:</strong> {status} - {msg_str}</li>"
-                )
-            else:
-                list_items.append(
-                    f"<li><strong>{cat}:</strong> {status}</li>"
-                )
-        details_html = (
-            '<ul style="margin:0;padding-left:18px">' + ''.join(list_items) + '</ul>'
-        )
-        overall_status = 'SKIPPED' if all_skipped else ('ERROR' if has_error else 'OK')
-        rows.append(
-            {
-                'promo': d.name,
-                'status': overall_status,
-                'errors': error_count,
-                'details': details_html,
-            }
-        )
-    logging.info('[buildSummary] Promotions summarised', extra={'rows': rows})
-    # Build HTML table
-    html_rows: List[str] = []
-    for r in rows:
-        status_display = (
-            '✅ OK' if r['status'] == 'OK' else ('❌ ERROR' if r['status'] == 'ERROR' else '⏭️ SKIPPED')
-        )
-        html_rows.append(
-            f"<tr><td>{r['promo']}</td><td>{status_display}</td>"
-            f"<td style=\"text-align:center\">{r['errors']}</td>"
-            f"<td>{r['details']}</td></tr>"
-        )
-    html = (
-        '<div style="font-family:Arial,Helvetica,sans-serif">'
-        '<h3>Resumen de validaciones BRIEF</h3>'
-        '<table border="1" cellspacing="0" cellpadding="6">'
-        '<tr><th>Promoción</th><th>Estado</th><th>Errores</th><th>Detalles</th></tr>'
-        f"{''.join(html_rows)}"'</table></div>'
+                        missing = cat_data.get('missing') or []
+                        extra = cat_data.get('extra') or []
+                        parts = []
+                        if missing:
+                            parts.append(f"faltan {', '.join(missing)}")
+                        if extra:
+                            parts.append(f"sobran {', '.join(extra)}")
+                        if parts:
+                            tmp_msgs.append(f"Seg {seg_id}: {' y '.join(parts)}")
+                        else:
+                            tmp_msgs.append(f"Seg {seg_id}: diferencias en etapas")
+        # Determine overall status for the category
+        if any_error:
+            status = 'ERROR'
+        elif any_ok:
+            status = 'OK'
+        else:
+            status = 'SKIPPED'
+        category_statuses[cat] = status
+        if tmp_msgs:
+            category_msgs[cat] = tmp_msgs
+        if status != 'SKIPPED':
+            all_skipped = False
+        if status == 'ERROR':
+            has_error = True
+            error_count += 1
+    overall_status = 'SKIPPED' if all_skipped else ('ERROR' if has_error else 'OK')
+    if all_skipped and not include_skipped:
+        return {'promo': name, 'status': overall_status, 'errors': error_count, 'details': ''}
+    # Build the detail string combining statuses and messages
+    # Format as an unordered list for better readability
+    # Multiple messages are joined with semicolons inside the list item
+    details_html = (
+        '<ul style="margin:0;padding-left:18px">'
+        + ''.join([
+            f"<li><strong>{cat}:</strong> {str(status).translate(_HTML_ESC)}"
+            f" - {'; '.join(msgs).translate(_HTML_ESC)}</li>"
+            if (msgs := category_msgs.get(cat))
+            else f"<li><strong>{cat}:</strong> {str(status).translate(_HTML_ESC)}</li>"
+            for cat, status in category_statuses.items()
+        ])
+        + '</ul>'
+    )
+    return {
+        'promo': name,
+        'status': overall_status,
+        'errors': error_count,
+        'details': details_html,
+    }
+
+
+def iter_summary_rows(include_skipped: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yield one summary row per promotion directory as it is processed.
+
+    Directories are read on a thread pool: the summary reads a handful
+    of tiny files per promotion, so the time goes to open/read syscalls
+    rather than parsing, and overlapping them hides most of that latency.
+    Rows come out in directory order as soon as each promotion's files
+    are loaded.  See ``_summarise_promo`` for ``include_skipped``.
+    """
+    base = Path('pages/Brief/Validaciones')
+    logging.info('[buildSummary] Reading summaries from', extra={'base': str(base)})
+    # ``DirEntry.is_dir`` answers from the directory listing itself
+    try:
+        with os.scandir(base) as it:
+            dirs = [e for e in it if e.is_dir()]
+    except OSError:
+        dirs = []
+    if not dirs:
+        return
+    with ThreadPoolExecutor(max_workers=min(32, 4 * len(dirs))) as executor:
+        paths = [e.path for e in dirs]
+        for d, files in zip(dirs, executor.map(_read_dir, paths, repeat(_FILE_NAMES))):
+            yield _summarise_promo(d.name, files, include_skipped)
+
+
+def _row_html(r: Dict[str, Any]) -> str:
+    status_display = _STATUS_DISPLAY.get(r['status'], '⏭️ SKIPPED')
+    return (
+        f"<tr><td>{r['promo'].translate(_HTML_ESC)}</td><td>{status_display}</td>"
+        f"<td style=\"text-align:center\">{r['errors']}</td>"
+        f"<td>{r['details']}</td></tr>"
     )
-    return html, rows
 
 
-def send_summary_email(extra_to: Optional[List[str]] = None) -> None:
+def iter_summary_html(
+    rows: Optional[Iterable[Dict[str, Any]]] = None,
+    skipped: int = 0,
+) -> Iterator[str]:
+    """Yield the summary HTML table in fragments.
+
+    The header comes first, then one ``<tr>`` per row and finally the
+    closing tags.  ``rows`` defaults to ``iter_summary_rows()``, so the
+    table can be written out while promotions are still being read.
+    A non-zero ``skipped`` adds a single row counting the promotions
+    left out of the table.
+    """
+    yield _HTML_PREFIX
+    for r in iter_summary_rows() if rows is None else rows:
+        yield _row_html(r)
+    if skipped:
+        yield f'<tr><td colspan="4">+{skipped} promociones omitidas (⏭️ SKIPPED)</td></tr>'
+    yield _HTML_SUFFIX
+
+
+def build_summary(include_skipped: bool = False) -> Tuple[str, List[Dict[str, Any]]]:
+    """Build an HTML summary of all promotion validations.
+
+    This implementation supports both legacy per-category summary files
+    (``validacion_multiplicador.json`` etc.) and the newer per-segment
+    validation lists (``validacion_segmentos.json`` and ``validacion_etapas.json``).
+    It produces an overall status per promotion and collates error messages
+    from individual segments into the details column.
+
+    Promotions whose categories were all SKIPPED are left out of the
+    table and of ``rows`` unless ``include_skipped`` is set; a single
+    row reports how many were omitted.
+
+    Returns a tuple of (html, rows).  Each row is a dict with keys
+    ``promo``, ``status``, ``errors`` and ``details``.
+    """
+    rows = list(iter_summary_rows(include_skipped))
+    skipped = 0
+    if not include_skipped:
+        shown = [r for r in rows if r['status'] != 'SKIPPED']
+        skipped = len(rows) - len(shown)
+        rows = shown
+    logging.info('[buildSummary] Promotions summarised', extra={'rows': rows, 'skipped': skipped})
+    return ''.join(iter_summary_html(rows, skipped)), rows
+
+
+def send_summary_email(extra_to: Optional[List[str]] = None, include_skipped: bool = False) -> None:
     """Send the summary email to default and extra recipients."""
-    html, rows = build_summary()
+    html, rows = build_summary(include_skipped)
     incorrectas = [r['promo'] for r in rows if r['status'] == 'ERROR']
     if incorrectas:
         subject = f"BRIEF: {len(incorrectas)} promociones con errores ({', '.join(incorrectas)})"